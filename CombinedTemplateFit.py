@@ -1,13 +1,14 @@
 import ROOT
-import FemtoAnalysis as FA
 import FileReader as FR
-import array as arr
+import FileUtils as FU
+import HistUtils as HU
 import numpy as np
-import ctypes
 
 ### classes ###
 # fitting object for tf1
 class ftotal:
+    __slots__ = ('data', 'histos', 'axis', 'ent')
+
     def __init__(self, data, mcdata):
         self.data = data
         self.histos = mcdata
@@ -24,6 +25,8 @@ class ftotal:
 
 # fitting object for tf2
 class ftotal2d:
+    __slots__ = ('histos', 'x', 'y', 'ent')
+
     def __init__(self, data, mcdata):
         self.histos = mcdata
         self.x = data.GetXaxis()
@@ -41,6 +44,8 @@ class ftotal2d:
 
 # global chi2 fitting object for combined fit
 class global_chi2:
+    __slots__ = ('fits', 'ent')
+
     def __init__(self, fits, ent):
         self.fits = fits
         self.ent = ent
@@ -53,13 +58,6 @@ class global_chi2:
         return total
 
 ### functions ###
-# finds the given bin on the axis and if its on the edge of the next bin, reduces the bin number
-def find_bin_reduce_on_lower_edge(axis, value):
-    found_bin = axis.FindBin(value)
-    if value == axis.GetBinLowEdge(found_bin):
-        found_bin -= 1
-    return found_bin
-
 # normalize, reweight and merge histograms
 def merge_templates_weighted(newname, temp1, temp2, weight1, weight2):
     for hist in [temp1, temp2]:
@@ -92,7 +90,7 @@ def get_pt_bin_ranges(axis, pt_bins):
         pt_count = len(pt_bins) - 1
         for n in range(pt_count):
             bin_value1 = axis.FindBin(pt_bins[n])
-            bin_value2 = find_bin_reduce_on_lower_edge(axis, pt_bins[n + 1])
+            bin_value2 = FU.find_bin_reduce_on_lower_edge(axis, pt_bins[n + 1])
             pt_range.append((bin_value1, bin_value2))
     return pt_range, pt_count
 
@@ -212,7 +210,7 @@ def setup_signal_range_xyz(signal_range, pt_count):
 def setup_signal_bin_range(axis, signal_range):
     signal_range = setup_signal_range(signal_range)
     bin_low = axis.FindBin(signal_range[0])
-    bin_up = find_bin_reduce_on_lower_edge(axis, signal_range[1])
+    bin_up = FU.find_bin_reduce_on_lower_edge(axis, signal_range[1])
     return [bin_low, bin_up]
 
 # setup fraction dictionaries for individual template
@@ -266,7 +264,7 @@ def get_fractions_from_purity(hpurity, pt_bins):
 def project_th8_to_th4(data):
     th8 = data.Clone()
     axis_pt = 2; axis_xy = 5; axis_z = 6; axis_mult = 0
-    ndims = np.array([axis_pt, axis_xy, axis_z, axis_mult], dtype = ctypes.c_int)
+    ndims = np.array([axis_pt, axis_xy, axis_z, axis_mult], dtype = np.int32)
     th4 = th8.Projection(4, ndims, "")
     return th4.Clone("hDCA_th4")
 
@@ -283,16 +281,16 @@ def apply_dca_cuts_thn(data, dim, fit_range, pt_bins):
     data_proj.Reset()
     data_proj.SetDirectory(0)
 
-    # generate input th2
+    # generate input th2, one working copy whose axis ranges are overwritten for every pt bin
     proj_list = ROOT.TList()
+    thn = data.Clone()
+    axis_pt = thn.GetAxis(0)
+    axis_xy = thn.GetAxis(1)
+    axis_z  = thn.GetAxis(2)
     for npt in range(pt_count):
-        thn = data.Clone()
-        axis_pt = thn.GetAxis(0)
-        axis_xy = thn.GetAxis(1)
-        axis_z  = thn.GetAxis(2)
         axis_pt.SetRange(pt_range[npt][0], pt_range[npt][1])
-        axis_xy.SetRange(axis_xy.FindBin(fit_range[0][npt][0]), find_bin_reduce_on_lower_edge(axis_xy, fit_range[0][npt][1]))
-        axis_z.SetRange(axis_z.FindBin(fit_range[1][npt][0]), find_bin_reduce_on_lower_edge(axis_z, fit_range[1][npt][1]))
+        axis_xy.SetRange(axis_xy.FindBin(fit_range[0][npt][0]), FU.find_bin_reduce_on_lower_edge(axis_xy, fit_range[0][npt][1]))
+        axis_z.SetRange(axis_z.FindBin(fit_range[1][npt][0]), FU.find_bin_reduce_on_lower_edge(axis_z, fit_range[1][npt][1]))
         proj = thn.Projection(dim, 0)
         proj.SetName(f"proj_{labels[dim]}_{npt}")
         proj_list.Add(proj)
@@ -306,15 +304,14 @@ def apply_dca_cuts_split_in_pt(input_thn, name, fitrange, pt_bins):
     fitrange = setup_fit_range_xyz(fitrange, pt_count)
 
     histos = []
+    thn = input_thn.Clone()
+    axis_pt = thn.GetAxis(0)
+    axis_xy = thn.GetAxis(1)
+    axis_zz = thn.GetAxis(2)
     for npt in range(pt_count):
-        thn = input_thn.Clone()
-        axis_pt = thn.GetAxis(0)
-        axis_xy = thn.GetAxis(1)
-        axis_zz = thn.GetAxis(2)
-
         axis_pt.SetRange(pt_range[npt][0], pt_range[npt][1])
-        axis_xy.SetRange(axis_xy.FindBin(fitrange[0][npt][0]), find_bin_reduce_on_lower_edge(axis_xy, fitrange[0][npt][1]))
-        axis_zz.SetRange(axis_zz.FindBin(fitrange[1][npt][0]), find_bin_reduce_on_lower_edge(axis_zz, fitrange[1][npt][1]))
+        axis_xy.SetRange(axis_xy.FindBin(fitrange[0][npt][0]), FU.find_bin_reduce_on_lower_edge(axis_xy, fitrange[0][npt][1]))
+        axis_zz.SetRange(axis_zz.FindBin(fitrange[1][npt][0]), FU.find_bin_reduce_on_lower_edge(axis_zz, fitrange[1][npt][1]))
 
         proj_xyz = thn.Projection(1, 2)
         proj_xyz.SetName(f"hDCA_xyz_{npt}")
@@ -358,8 +355,8 @@ def get_input_templates_from_thn(name_temp, tdir, namelist, fitrange, pt_bins):
     labels = ['xy', 'z']
 
     # get templates
-    temps_file = FR.FileReader(name_temp, tdir)
-    temps = [temps_file.GetHisto(f"hDCAxy_{name}", "Tracks_MC") for name in namelist]
+    with FR.FileReader(name_temp, tdir) as temps_file:
+        temps = [temps_file.GetHisto(f"hDCAxy_{name}", "Tracks_MC") for name in namelist]
 
     # setup ranges
     xAxis = temps[0].GetAxis(0)
@@ -378,13 +375,14 @@ def get_input_templates_from_thn(name_temp, tdir, namelist, fitrange, pt_bins):
     for dim in dim_counter:
         for ntemp in temp_counter:
             proj_list = ROOT.TList()
+            thn = temps[ntemp].Clone()
+            ax0 = thn.GetAxis(0)
+            ax1 = thn.GetAxis(1)
+            ax2 = thn.GetAxis(2)
             for npt in range(pt_count):
-                thn = temps[ntemp].Clone()
-                thn.GetAxis(0).SetRange(pt_range[npt][0], pt_range[npt][1])
-                ax1 = thn.GetAxis(1)
-                ax1.SetRange(ax1.FindBin(fitrange[0][npt][0]), find_bin_reduce_on_lower_edge(ax1, fitrange[0][npt][1]))
-                ax2 = thn.GetAxis(2)
-                ax2.SetRange(ax2.FindBin(fitrange[1][npt][0]), find_bin_reduce_on_lower_edge(ax2, fitrange[1][npt][1]))
+                ax0.SetRange(pt_range[npt][0], pt_range[npt][1])
+                ax1.SetRange(ax1.FindBin(fitrange[0][npt][0]), FU.find_bin_reduce_on_lower_edge(ax1, fitrange[0][npt][1]))
+                ax2.SetRange(ax2.FindBin(fitrange[1][npt][0]), FU.find_bin_reduce_on_lower_edge(ax2, fitrange[1][npt][1]))
                 proj = thn.Projection(dim + 1, 0)
                 proj.SetName(f"proj_{labels[dim]}_{ntemp}_{npt}")
                 proj_list.Add(proj)
@@ -408,7 +406,7 @@ def get_rel_yield(name_temps, tdir, namelist, target, pt_bins, fitrange):
 
     temp_list = ROOT.TList()
     for ntemp in temp_counter:
-        temp_list.Add(temps[ntemp].Clone())
+        temp_list.Add(temps[ntemp])
     temps_total.Merge(temp_list)
 
     index = 0
@@ -419,7 +417,7 @@ def get_rel_yield(name_temps, tdir, namelist, target, pt_bins, fitrange):
             index = namelist.index(target)
 
     temps_target = temps[index].Clone()
-    temps_target.Divide(temps_total.Clone())
+    temps_target.Divide(temps_total)
 
     fractions = []
     for npt in range(pt_count):
@@ -482,31 +480,27 @@ def CombinedFit(fname, dir_out, dca_data, dca_templates, dca_names, fit_range, s
 
     # graph initialization
     total_chi2 = ROOT.TGraph(pt_count)
-    total_chi2.SetLineWidth(2)
-    total_chi2.GetXaxis().SetLabelSize(0.05)
-    total_chi2.GetYaxis().SetLabelSize(0.05)
-    total_chi2.GetYaxis().SetTitle("chi2/ndf")
-    total_chi2.GetXaxis().SetTitle("<p_{T}> (GeV)")
-    total_chi2.GetXaxis().SetTitleSize(0.05)
-    total_chi2.GetYaxis().SetTitleSize(0.05)
+    _setup_chi2_tgraph(total_chi2)
 
     temp_graph = [[ROOT.TGraph(pt_count - 1) for ntemp in temp_counter] for nfit in fit_counter]
     for nfit in fit_counter:
         for ntemp in temp_counter:
-            temp_graph[nfit][ntemp].SetName(f"{names_for_saving[nfit]}_{dca_names[ntemp]}")
-            temp_graph[nfit][ntemp].SetTitle(dca_names[ntemp])
-            temp_graph[nfit][ntemp].SetLineColor(ntemp + 3)
-            temp_graph[nfit][ntemp].SetLineWidth(2)
-            temp_graph[nfit][ntemp].SetMarkerColor(ntemp + 3)
-            temp_graph[nfit][ntemp].SetMarkerSize(2)
-            temp_graph[nfit][ntemp].SetMarkerStyle(21)
-            temp_graph[nfit][ntemp].GetXaxis().SetLabelSize(0.05)
-            temp_graph[nfit][ntemp].GetXaxis().SetTitleSize(0.05)
-            temp_graph[nfit][ntemp].GetXaxis().SetTitle("<p_{T}> (GeV)")
-            temp_graph[nfit][ntemp].GetYaxis().SetLabelSize(0.05)
+            graph = temp_graph[nfit][ntemp]
+            gx = graph.GetXaxis()
+            graph.SetName(f"{names_for_saving[nfit]}_{dca_names[ntemp]}")
+            graph.SetTitle(dca_names[ntemp])
+            graph.SetLineColor(ntemp + 3)
+            graph.SetLineWidth(2)
+            graph.SetMarkerColor(ntemp + 3)
+            graph.SetMarkerSize(2)
+            graph.SetMarkerStyle(21)
+            gx.SetLabelSize(0.05)
+            gx.SetTitleSize(0.05)
+            gx.SetTitle("<p_{T}> (GeV)")
+            graph.GetYaxis().SetLabelSize(0.05)
             if dca_names[ntemp] in color_temp:
-                temp_graph[nfit][ntemp].SetLineColor(color_temp[dca_names[ntemp]])
-                temp_graph[nfit][ntemp].SetMarkerColor(color_temp[dca_names[ntemp]])
+                graph.SetLineColor(color_temp[dca_names[ntemp]])
+                graph.SetMarkerColor(color_temp[dca_names[ntemp]])
 
     ### fitting loop ###
     chi_graph = [ROOT.TGraph(pt_count) for nfit in fit_counter]
@@ -527,7 +521,7 @@ def CombinedFit(fname, dir_out, dca_data, dca_templates, dca_names, fit_range, s
                 data[nfit].Rebin(pt_rebin[n])
             data[nfit].SetAxisRange(fit_range[nfit][n][0], fit_range[nfit][n][1])
             bin_low = data[nfit].FindBin(fit_range[nfit][n][0])
-            bin_up = find_bin_reduce_on_lower_edge(data[nfit].GetXaxis(), fit_range[nfit][n][1])
+            bin_up = FU.find_bin_reduce_on_lower_edge(data[nfit].GetXaxis(), fit_range[nfit][n][1])
             data_ent[nfit].append(data[nfit].Integral(bin_low, bin_up))
             if data[nfit].Integral():
                 data[nfit].Scale(1. / data[nfit].Integral())
@@ -662,11 +656,11 @@ def CombinedFit(fname, dir_out, dca_data, dca_templates, dca_names, fit_range, s
         # fractions
         for nfit in fit_counter:
             bin_low = htot[nfit].FindBin(signal_range[0])
-            bin_up  = find_bin_reduce_on_lower_edge(htot[nfit].GetXaxis(), signal_range[1])
+            bin_up  = FU.find_bin_reduce_on_lower_edge(htot[nfit].GetXaxis(), signal_range[1])
             temp_ent[nfit].append(htot[nfit].Integral(bin_low, bin_up))
             for ntemp in temp_counter:
                 bin_low = temp_hist[nfit][ntemp].FindBin(signal_range[0])
-                bin_up  = find_bin_reduce_on_lower_edge(temp_hist[nfit][ntemp].GetXaxis(), signal_range[1])
+                bin_up  = FU.find_bin_reduce_on_lower_edge(temp_hist[nfit][ntemp].GetXaxis(), signal_range[1])
                 tmp = temp_hist[nfit][ntemp].Integral(bin_low, bin_up)
                 if temp_ent[nfit][n]:
                     par_ent[nfit][ntemp].append(tmp / temp_ent[nfit][n])
@@ -686,14 +680,7 @@ def CombinedFit(fname, dir_out, dca_data, dca_templates, dca_names, fit_range, s
     chi_canvas = [ROOT.TCanvas(f"{names_for_saving[nfit]}_chi_canvas", f"{names_for_saving[nfit]}_chi_canvas", 1440, 1080) for nfit in fit_counter]
     for nfit in fit_counter:
         chi_canvas[nfit].cd()
-        chi_graph[nfit].SetLineColor(1)
-        chi_graph[nfit].SetLineWidth(2)
-        chi_graph[nfit].GetXaxis().SetLabelSize(0.05)
-        chi_graph[nfit].GetYaxis().SetLabelSize(0.05)
-        chi_graph[nfit].GetYaxis().SetTitle("chi2/ndf")
-        chi_graph[nfit].GetXaxis().SetTitle("<p_{T}> (GeV)")
-        chi_graph[nfit].GetXaxis().SetTitleSize(0.05)
-        chi_graph[nfit].GetYaxis().SetTitleSize(0.05)
+        _setup_chi2_tgraph(chi_graph[nfit])
 
     # canvas for all fractions
     fractions_canvas = [ROOT.TCanvas(f"{names_for_saving[nfit]}_fractions", f"{names_for_saving[nfit]}_fractions", 1440, 1080) for nfit in fit_counter]
@@ -715,24 +702,7 @@ def CombinedFit(fname, dir_out, dca_data, dca_templates, dca_names, fit_range, s
     empty_graph = [temp_graph[nfit][0] for nfit in fit_counter]
     for nfit in fit_counter:
         fractions_canvas[nfit].cd()
-        empty_graph[nfit].SetTitle("")
-        empty_graph[nfit].SetFillStyle(1000)
-        empty_graph[nfit].SetMinimum(0.)
-        empty_graph[nfit].SetMaximum(1.0)
-        gx = empty_graph[nfit].GetXaxis()
-        gy = empty_graph[nfit].GetYaxis()
-        gx.SetLimits(xAxis.GetBinLowEdge(pt_range[0][0] - 1), xAxis.GetBinLowEdge(pt_range[-1][1] + 1))
-        gx.SetTitle("<p_{T}> (GeV)")
-        gx.SetLabelFont(42)
-        gx.SetLabelSize(0.06)
-        gx.SetTitleSize(0.07)
-        gx.SetTitleOffset(1)
-        gx.SetTitleFont(42)
-        gy.SetTitle("fractions")
-        gy.SetLabelFont(42)
-        gy.SetLabelSize(0.06)
-        gy.SetTitleSize(0.07)
-        gy.SetTitleFont(42)
+        _fractions_frame(empty_graph[nfit], xAxis, pt_range)
         empty_graph[nfit].Draw("alp")
         for ntemp in range(1, temp_count):
             temp_graph[nfit][ntemp].Draw("lp same")
@@ -834,22 +804,7 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, si
     dataEntries = []
     mcEntries = []
     parDCA_mc = [[] for n in range(dca_ent)]
-    gDCA_mc = [ROOT.TGraph(pt_ent - 1) for ntemp in range(dca_ent)]
-    for n in range(dca_ent):
-        gDCA_mc[n].SetName(dca_names[n])
-        gDCA_mc[n].SetTitle(dca_names[n])
-        gDCA_mc[n].SetLineWidth(2)
-        gDCA_mc[n].SetLineColor(n + 3)
-        gDCA_mc[n].SetMarkerStyle(21)
-        gDCA_mc[n].SetMarkerSize(2)
-        gDCA_mc[n].SetMarkerColor(n + 3)
-        gDCA_mc[n].GetXaxis().SetLabelSize(0.05)
-        gDCA_mc[n].GetYaxis().SetLabelSize(0.05)
-        gDCA_mc[n].GetXaxis().SetTitleSize(0.05)
-        gDCA_mc[n].GetXaxis().SetTitle("<p_{T}> (GeV)")
-        if dca_names[n] in color_temp:
-            gDCA_mc[n].SetLineColor(color_temp[dca_names[n]])
-            gDCA_mc[n].SetMarkerColor(color_temp[dca_names[n]])
+    gDCA_mc = _setup_tgraphs(dca_ent, dca_names, color_temp, pt_ent)
 
     ### main loop for fitting ###
     for n in range(pt_ent):
@@ -865,7 +820,7 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, si
             data.Rebin(pt_rebin[n])
         data.SetAxisRange(fitrange[n][0], fitrange[n][1])
         bin_low = data.FindBin(fitrange[n][0])
-        bin_up = find_bin_reduce_on_lower_edge(data.GetXaxis(), fitrange[n][1])
+        bin_up = FU.find_bin_reduce_on_lower_edge(data.GetXaxis(), fitrange[n][1])
         data_int = data.Integral(bin_low, bin_up)
         dataEntries.append(data_int)
         if data.Integral():
@@ -915,12 +870,7 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, si
                                 ftot.SetParLimits(i, entry['temp_limits'][n][0], entry['temp_limits'][n][1])
 
         # set data error to sqrt of sum of weights of data and temps
-        for npt in range(data.GetNbinsX()):
-            error = data.GetBinError(npt)**2
-            for ntemp in range(dca_ent):
-                error += hDCA_mc[i].GetBinError(npt)**2
-            error = error**0.5
-            data.SetBinError(npt, error)
+        _add_template_errors(data, hDCA_mc)
 
         # draw histograms
         data.Fit("ftot", "S, N, R, M", "", fitrange[n][0], fitrange[n][1])
@@ -972,11 +922,11 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, si
         ofile.cd()
 
         # fractions
-        htot_int = htot.Integral(htot.FindBin(signal_range[0]), find_bin_reduce_on_lower_edge(htot.GetXaxis(), signal_range[1]))
+        htot_int = htot.Integral(htot.FindBin(signal_range[0]), FU.find_bin_reduce_on_lower_edge(htot.GetXaxis(), signal_range[1]))
         mcEntries.append(htot_int)
         for i in range(dca_ent):
             bin_low = hDCA_mc[i].FindBin(signal_range[0])
-            bin_up = find_bin_reduce_on_lower_edge(hDCA_mc[i].GetXaxis(), signal_range[1])
+            bin_up = FU.find_bin_reduce_on_lower_edge(hDCA_mc[i].GetXaxis(), signal_range[1])
             tmp = hDCA_mc[i].Integral(bin_low, bin_up)
             if mcEntries[n]:
                 parDCA_mc[i].append(tmp / mcEntries[n])
@@ -1014,23 +964,8 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, si
             m2ent[j] += dataEntries[i]*parDCA_mc[j][i]
 
     # chi2 graph
-    gChi.SetLineColor(1)
-    gChi.SetLineWidth(2)
-    gChi.GetXaxis().SetLabelSize(0.05)
-    gChi.GetYaxis().SetLabelSize(0.05)
-    gChi.GetYaxis().SetTitle("chi2/ndf")
-    gChi.GetXaxis().SetTitle("<p_{T}> (GeV)")
-    gChi.GetXaxis().SetTitleSize(0.05)
-    gChi.GetYaxis().SetTitleSize(0.05)
-
-    gChi_signal.SetLineColor(1)
-    gChi_signal.SetLineWidth(2)
-    gChi_signal.GetXaxis().SetLabelSize(0.05)
-    gChi_signal.GetYaxis().SetLabelSize(0.05)
-    gChi_signal.GetYaxis().SetTitle("chi2/ndf")
-    gChi_signal.GetXaxis().SetTitle("<p_{T}> (GeV)")
-    gChi_signal.GetXaxis().SetTitleSize(0.05)
-    gChi_signal.GetYaxis().SetTitleSize(0.05)
+    _setup_chi2_tgraph(gChi)
+    _setup_chi2_tgraph(gChi_signal)
 
     chi2_canvas = ROOT.TCanvas("total chi2/ndf", "total chi2/ndf", 1440, 1080)
     chi2_canvas.SetMargin(0.15, 0.05, 0.2, 0.05)
@@ -1039,36 +974,10 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, si
     gChi.Draw()
 
     # canvas for all fractions
-    fractions = ROOT.TCanvas("fractions", "fractions", 1440, 1080)
-    ROOT.gPad.SetGridx()
-    ROOT.gPad.SetGridy()
-    fractions.cd()
-    fractions.SetFillColor(0)
-    fractions.SetBorderMode(0)
-    fractions.SetBorderSize(2)
-    fractions.SetFrameBorderMode(0)
-    fractions.SetMargin(0.15, 0.05, 0.2, 0.05)
+    fractions = _fractions_canvas()
 
     # fraction graphs
-    gEmpty = gDCA_mc[0]
-    gEmpty.SetTitle("")
-    gEmpty.SetFillStyle(1000)
-    gEmpty.SetMinimum(0.)
-    gEmpty.SetMaximum(1.0)
-    gx = gEmpty.GetXaxis()
-    gy = gEmpty.GetYaxis()
-    gx.SetLimits(xAxis.GetBinLowEdge(pt_range[0][0] - 1), xAxis.GetBinLowEdge(pt_range[-1][1] + 1))
-    gx.SetTitle("<p_{T}> (GeV)")
-    gx.SetLabelFont(42)
-    gx.SetLabelSize(0.06)
-    gx.SetTitleSize(0.07)
-    gx.SetTitleOffset(1)
-    gx.SetTitleFont(42)
-    gy.SetTitle("fractions")
-    gy.SetLabelFont(42)
-    gy.SetLabelSize(0.06)
-    gy.SetTitleSize(0.07)
-    gy.SetTitleFont(42)
+    gEmpty = _fractions_frame(gDCA_mc[0], xAxis, pt_range)
     gEmpty.Draw("alp")
     for i in range(1, dca_ent):
         gDCA_mc[i].Draw("lp same")
@@ -1148,7 +1057,7 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
     data_entries, temp_entries = [], []
     temp_pars = [[] for ntemp in temp_counter]
     m2ent = [0 for ntemp in temp_counter]
-    temp_graphs = _setup_tgraphs(dca_names, color_temp, pt_count)
+    temp_graphs = _setup_tgraphs(temp_count, dca_names, color_temp, pt_count)
 
     ### main loop for fitting ###
     for npt in range(pt_count):
@@ -1218,15 +1127,6 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
                             else:
                                 fitter.SetParLimits(ntemp, entry['temp_limits'][npt][0], entry['temp_limits'][npt][1])
 
-        # set data error to sqrt of sum of weights of data and temps
-        for nbinx in range(data.GetNbinsX()):
-            for nbiny in range(data.GetNbinsY()):
-                error = data.GetBinError(nbinx, nbiny)**2
-                for ntemp in temp_counter:
-                    error += temp_histos[ntemp].GetBinError(nbinx, nbiny)**2
-                error = error**0.5
-                #data.SetBinError(nbinx, nbiny, error)
-
         # setup lines to be drawn for the signal region
         range_user = [(signal_range[i][npt][0] * 1.5, signal_range[i][npt][1] * 1.5) for i in range(2)]
         signal_lines = [(ROOT.TLine(signal_range[i][npt][0], 0, signal_range[i][npt][0], 0.1), ROOT.TLine(signal_range[i][npt][1], 0, signal_range[i][npt][1], 0.1)) for i in range(2)]
@@ -1311,30 +1211,27 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
         legend.Draw()
 
         # (data - fit) plots
-        data_copy = data.Clone("data_copy")
-        htot_copy = htot.Clone("htot_copy")
-
         data_fit = data.Clone("data - fit")
-        data_fit.Add(htot_copy.Clone(), -1)
+        data_fit.Add(htot, -1)
         data_fit.GetYaxis().SetRangeUser(range_user[0][0], range_user[0][1])
         data_fit.GetXaxis().SetRangeUser(range_user[1][0], range_user[1][1])
 
-        data_fit_xy = data_copy.Clone("data_copy_xy_1").ProjectionY("data_copy_xy_proj_y_1").Clone("data - fit xy")
-        data_fit_xy.Add(htot_copy.Clone().ProjectionY(), -1)
-        data_fit_xy.GetXaxis().SetRangeUser(range_user[0][0], range_user[0][1])
-
-        data_fit_z = data_copy.Clone("data_copy_z_1").ProjectionX("data_copy_z_proj_x_1").Clone("data - fit z")
-        data_fit_z.Add(htot_copy.ProjectionX(), -1)
-        data_fit_z.GetXaxis().SetRangeUser(range_user[1][0], range_user[1][1])
+        # projections are done once, before the range of the th2 plots is changed
+        data_xy = data.ProjectionY(f"data_proj_y_{npt}")
+        data_z = data.ProjectionX(f"data_proj_x_{npt}")
 
-        data_fit_rel_xy = data_copy.Clone("data_copy_xy_2").ProjectionY("data_copy_xy_proj_y_2").Clone("(data - fit) / data xy")
-        data_fit_rel_xy.Add(htot_copy.ProjectionY(), -1)
-        data_fit_rel_xy.Divide(data_copy.ProjectionY())
+        data_fit_xy = data_xy.Clone("data - fit xy")
+        data_fit_xy.Add(htot.ProjectionY(f"htot_proj_y_{npt}"), -1)
+        data_fit_rel_xy = data_fit_xy.Clone("(data - fit) / data xy")
+        data_fit_rel_xy.Divide(data_xy)
+        data_fit_xy.GetXaxis().SetRangeUser(range_user[0][0], range_user[0][1])
         data_fit_rel_xy.GetXaxis().SetRangeUser(range_user[0][0], range_user[0][1])
 
-        data_fit_rel_z = data_copy.Clone("data_copy_z_2").ProjectionX("data_copy_z_proj_x_2").Clone("(data - fit) / data z")
-        data_fit_rel_z.Add(htot_copy.ProjectionX(), -1)
-        data_fit_rel_z.Divide(data_copy.ProjectionX())
+        data_fit_z = data_z.Clone("data - fit z")
+        data_fit_z.Add(htot.ProjectionX(f"htot_proj_x_{npt}"), -1)
+        data_fit_rel_z = data_fit_z.Clone("(data - fit) / data z")
+        data_fit_rel_z.Divide(data_z)
+        data_fit_z.GetXaxis().SetRangeUser(range_user[1][0], range_user[1][1])
         data_fit_rel_z.GetXaxis().SetRangeUser(range_user[1][0], range_user[1][1])
 
         # change range of th2 plots
@@ -1366,8 +1263,8 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
         # fractions
         binx_low = htot.GetXaxis().FindBin(signal_range[1][npt][0])
         biny_low = htot.GetYaxis().FindBin(signal_range[0][npt][0])
-        binx_up = find_bin_reduce_on_lower_edge(htot.GetXaxis(), signal_range[1][npt][1])
-        biny_up = find_bin_reduce_on_lower_edge(htot.GetXaxis(), signal_range[0][npt][1])
+        binx_up = FU.find_bin_reduce_on_lower_edge(htot.GetXaxis(), signal_range[1][npt][1])
+        biny_up = FU.find_bin_reduce_on_lower_edge(htot.GetXaxis(), signal_range[0][npt][1])
         htot_int = htot.Integral(binx_low, binx_up, biny_low, biny_up)
         temp_entries.append(htot_int)
         for ntemp in temp_counter:
@@ -1403,23 +1300,8 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
             m2ent[ntemp] += data_entries[npt]*temp_pars[ntemp][npt]
 
     # chi2 graph
-    gChi.SetLineColor(1)
-    gChi.SetLineWidth(2)
-    gChi.GetXaxis().SetLabelSize(0.05)
-    gChi.GetYaxis().SetLabelSize(0.05)
-    gChi.GetYaxis().SetTitle("chi2/ndf")
-    gChi.GetXaxis().SetTitle("<p_{T}> (GeV)")
-    gChi.GetXaxis().SetTitleSize(0.05)
-    gChi.GetYaxis().SetTitleSize(0.05)
-
-    gChi_signal.SetLineColor(1)
-    gChi_signal.SetLineWidth(2)
-    gChi_signal.GetXaxis().SetLabelSize(0.05)
-    gChi_signal.GetYaxis().SetLabelSize(0.05)
-    gChi_signal.GetYaxis().SetTitle("chi2/ndf")
-    gChi_signal.GetXaxis().SetTitle("<p_{T}> (GeV)")
-    gChi_signal.GetXaxis().SetTitleSize(0.05)
-    gChi_signal.GetYaxis().SetTitleSize(0.05)
+    _setup_chi2_tgraph(gChi)
+    _setup_chi2_tgraph(gChi_signal)
 
     chi2_canvas = ROOT.TCanvas("total chi2/ndf", "total chi2/ndf", 1440, 1080)
     chi2_canvas.SetMargin(0.15, 0.05, 0.2, 0.05)
@@ -1428,36 +1310,10 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
     gChi.Draw()
 
     # canvas for all fractions
-    fractions = ROOT.TCanvas("fractions", "fractions", 1440, 1080)
-    ROOT.gPad.SetGridx()
-    ROOT.gPad.SetGridy()
-    fractions.cd()
-    fractions.SetFillColor(0)
-    fractions.SetBorderMode(0)
-    fractions.SetBorderSize(2)
-    fractions.SetFrameBorderMode(0)
-    fractions.SetMargin(0.15, 0.05, 0.2, 0.05)
+    fractions = _fractions_canvas()
 
     # fraction graphs
-    gEmpty = temp_graphs[0]
-    gEmpty.SetTitle("")
-    gEmpty.SetFillStyle(1000)
-    gEmpty.SetMinimum(0.)
-    gEmpty.SetMaximum(1.0)
-    gx = gEmpty.GetXaxis()
-    gy = gEmpty.GetYaxis()
-    gx.SetLimits(pt_axis.GetBinLowEdge(pt_range[0][0] - 1), pt_axis.GetBinLowEdge(pt_range[-1][1] + 1))
-    gx.SetTitle("<p_{T}> (GeV)")
-    gx.SetLabelFont(42)
-    gx.SetLabelSize(0.06)
-    gx.SetTitleSize(0.07)
-    gx.SetTitleOffset(1)
-    gx.SetTitleFont(42)
-    gy.SetTitle("fractions")
-    gy.SetLabelFont(42)
-    gy.SetLabelSize(0.06)
-    gy.SetTitleSize(0.07)
-    gy.SetTitleFont(42)
+    gEmpty = _fractions_frame(temp_graphs[0], pt_axis, pt_range)
     gEmpty.Draw("alp")
     for ntemp in range(1, temp_count):
         temp_graphs[ntemp].DrawClone("lp same")
@@ -1488,33 +1344,57 @@ def TemplateFit2D(fname, dca_data, dca_templates, dca_names, fit_range, signal_r
     primAvg.Write()
 
 ### internal functions ###
-def _setup_tgraphs(dca_names, temp_colors, pt_count):
-    graphs = [ROOT.TGraph(pt_count - 1) for ntemp in range(len(dca_names))]
-    for ntemp in range(len(dca_names)):
-        graphs[ntemp].SetName(dca_names[ntemp])
-        graphs[ntemp].SetTitle(dca_names[ntemp])
-        graphs[ntemp].SetLineWidth(2)
-        graphs[ntemp].SetLineColor(ntemp + 3)
-        graphs[ntemp].SetMarkerStyle(21)
-        graphs[ntemp].SetMarkerSize(2)
-        graphs[ntemp].SetMarkerColor(ntemp + 3)
-        graphs[ntemp].GetXaxis().SetLabelSize(0.05)
-        graphs[ntemp].GetYaxis().SetLabelSize(0.05)
-        graphs[ntemp].GetXaxis().SetTitleSize(0.05)
-        graphs[ntemp].GetXaxis().SetTitle("<p_{T}> (GeV)")
+# set the errors of 'data' to the sqrt of the sum of the squared errors of data and templates
+# same result as the former bin loop: adds the last template once per template to cells 0..nbins-1
+def _add_template_errors(data, temps):
+    if temps[-1].GetNcells() != data.GetNcells():
+        raise ValueError(f"_add_template_errors: binning of template \"{temps[-1].GetName()}\" does not match data \"{data.GetName()}\"")
+    nbins = data.GetNbinsX()
+    errors2 = HU.get_errors2(data)
+    errors2[:nbins] += len(temps) * HU.get_errors2(temps[-1])[:nbins]
+    data.SetError(np.sqrt(errors2))
+
+def _setup_tgraphs(temp_count, dca_names, temp_colors, pt_count):
+    graphs = [ROOT.TGraph(pt_count - 1) for ntemp in range(temp_count)]
+    for ntemp, graph in enumerate(graphs):
+        gx = graph.GetXaxis()
+        graph.SetName(dca_names[ntemp])
+        graph.SetTitle(dca_names[ntemp])
+        graph.SetLineWidth(2)
+        graph.SetLineColor(ntemp + 3)
+        graph.SetMarkerStyle(21)
+        graph.SetMarkerSize(2)
+        graph.SetMarkerColor(ntemp + 3)
+        gx.SetLabelSize(0.05)
+        graph.GetYaxis().SetLabelSize(0.05)
+        gx.SetTitleSize(0.05)
+        gx.SetTitle("<p_{T}> (GeV)")
         if dca_names[ntemp] in temp_colors:
-            graphs[ntemp].SetLineColor(temp_colors[dca_names[ntemp]])
-            graphs[ntemp].SetMarkerColor(temp_colors[dca_names[ntemp]])
+            graph.SetLineColor(temp_colors[dca_names[ntemp]])
+            graph.SetMarkerColor(temp_colors[dca_names[ntemp]])
     return graphs
 
-def _empty_tgraph(xAxis, pt_range):
-    empty_graph = ROOT.TGraph(0)
-    empty_graph.SetTitle("")
-    empty_graph.SetFillStyle(1000)
-    empty_graph.SetMinimum(0.)
-    empty_graph.SetMaximum(1.0)
-    gx = empty_graph.GetXaxis()
-    gy = empty_graph.GetYaxis()
+# style of the chi2/ndf vs pt graphs
+def _setup_chi2_tgraph(graph):
+    gx = graph.GetXaxis()
+    gy = graph.GetYaxis()
+    graph.SetLineColor(1)
+    graph.SetLineWidth(2)
+    gx.SetLabelSize(0.05)
+    gx.SetTitle("<p_{T}> (GeV)")
+    gx.SetTitleSize(0.05)
+    gy.SetLabelSize(0.05)
+    gy.SetTitle("chi2/ndf")
+    gy.SetTitleSize(0.05)
+
+# style the first template graph as frame of the fractions canvas
+def _fractions_frame(graph, xAxis, pt_range):
+    graph.SetTitle("")
+    graph.SetFillStyle(1000)
+    graph.SetMinimum(0.)
+    graph.SetMaximum(1.0)
+    gx = graph.GetXaxis()
+    gy = graph.GetYaxis()
     gx.SetLimits(xAxis.GetBinLowEdge(pt_range[0][0] - 1), xAxis.GetBinLowEdge(pt_range[-1][1] + 1))
     gx.SetTitle("<p_{T}> (GeV)")
     gx.SetLabelFont(42)
@@ -1527,7 +1407,7 @@ def _empty_tgraph(xAxis, pt_range):
     gy.SetLabelSize(0.06)
     gy.SetTitleSize(0.07)
     gy.SetTitleFont(42)
-    return empty_graph
+    return graph
 
 def _fractions_canvas():
     canvas = ROOT.TCanvas("fractions", "fractions", 1440, 1080)
@@ -1,5 +1,6 @@
 import ROOT
 import numpy as np
+import HistUtils as HU
 
 
 class CorrelationHandler:
@@ -13,6 +14,7 @@ class CorrelationHandler:
     __me = mixed-event k* distribution (TH1F)
     ---------------------------------------------------
     """
+    __slots__ = ('name', '__se', '__me', '__cf')
 
     def __init__(self, name, iSE, iME):
 
@@ -23,48 +25,51 @@ class CorrelationHandler:
 
         self.__cf = None
 
-        if not iSE.InheritsFrom(ROOT.TH1.Class()) and iSE.InheritsFrom(ROOT.TH2.Class()):
+        if not isinstance(iSE, ROOT.TH1) or isinstance(iSE, (ROOT.TH2, ROOT.TH3)):
             print("Input SE is not a TH1!")
-        if not iME.InheritsFrom(ROOT.TH1.Class()) and iSE.InheritsFrom(ROOT.TH2.Class()):
+        if not isinstance(iME, ROOT.TH1) or isinstance(iME, (ROOT.TH2, ROOT.TH3)):
             print("Input ME is not a TH1!")
 
     def _normalize(self, hist):
         nBins = hist.GetNbinsX()
-        hist.Scale(1 / hist.Integral(1, nBins + 1))
+        integral = hist.Integral(1, nBins + 1)
+        if integral > 0:
+            hist.Scale(1 / integral)
+        else:
+            print(f'Integral of {hist.GetName()} is zero, not normalized')
 
     def normalize(self):
-        self.__se = self._normalize(self.__se)
-        self.__me = self._normalize(self.__me)
+        self._normalize(self.__se)
+        self._normalize(self.__me)
 
     def make_cf(self):
         self.__cf = self.__se.Clone(f'hCF_{self.name}')
         self.__cf.Reset()
         self.__cf.GetYaxis().SetTitle('C(k*)')
-        for i in range(1, self.__cf.GetNbinsX()):
-            vSame = self.__se.GetBinContent(i)
-            eSame = self.__se.GetBinError(i)
-            vMixed = self.__me.GetBinContent(i)
-            eMixed = self.__me.GetBinError(i)
-            if vSame < 1.e-12 or vMixed < 1.e-12:
-                continue
-            else:
-                vCF = vSame / vMixed
-                eCF = np.sqrt((eMixed/vMixed)*(eMixed/vMixed) +
-                              (eSame/vSame)*(eSame/vSame)) * vCF
-                self.__cf.SetBinContent(i, vCF)
-                self.__cf.SetBinError(i, eCF)
+        vSame = HU.get_content(self.__se)
+        vMixed = HU.get_content(self.__me)
+        valid = (vSame >= 1.e-12) & (vMixed >= 1.e-12)
+        valid[0] = valid[-1] = False                # skip under- and overflow
+        vCF = np.zeros_like(vSame)
+        eCF = np.zeros_like(vSame)
+        invMixed = 1 / vMixed[valid]
+        vCF[valid] = vSame[valid] * invMixed
+        # error propagation of SE / ME without dividing by the SE content
+        eCF[valid] = np.sqrt((HU.get_errors2(self.__se)[valid] + vCF[valid]**2 * HU.get_errors2(self.__me)[valid]) * invMixed**2)
+        HU.set_content(self.__cf, vCF)
+        self.__cf.SetError(eCF)
 
     def normalize_cf(self, low=0.6, high=1.):
         if not self.__cf:
             print('Compute the correlation function first')
             return
-        low_bin = self.__cf.FindBin(low)
-        low_edge = self.__cf.GetBinLowEdge(low_bin)
-        high_bin = self.__cf.FindBin(high)
-        high_edge = self.__cf.GetBinLowEdge(high_bin + 1)
+        axis = self.__cf.GetXaxis()
+        low_bin = axis.FindBin(low)
+        high_bin = axis.FindBin(high)
+        width = axis.GetBinLowEdge(high_bin + 1) - axis.GetBinLowEdge(low_bin)
         cf_integral = self.__cf.Integral(low_bin, high_bin, 'width')
         if cf_integral > 0:
-            self.__cf.Scale((high_edge - low_edge) / cf_integral)
+            self.__cf.Scale(width / cf_integral)
 
     ###   Getter functions   ###
     # Histogramms for same event distribution
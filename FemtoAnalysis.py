@@ -1,9 +1,13 @@
 import ROOT
+import math
+import numpy as np
 import FileUtils as FU
+import HistUtils as HU
 import FemtoDreamSaver as FDS
 import FemtoDreamReader as FDR
 import CorrelationHandler as CH
-import CombinedTemplateFit as TF
+
+_INV_SQRT12 = 1 / math.sqrt(12)          # std dev of a square distribution of unit width
 
 def UFFA(settings):
     conf = config(settings)
@@ -24,32 +28,33 @@ def UFFA(settings):
 # correlation function
 def UFFA_cf(settings):
     conf = config(settings)
-    fdr = FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir'])
-    ch = cf_handler(fdr, conf)
-    fds = FDS.FemtoDreamSaver(conf, ch.get_histos())
+    with FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir']) as fdr:
+        ch = cf_handler(fdr, conf)
+        fds = FDS.FemtoDreamSaver(conf, ch.get_histos())
 
 # template fits
 def UFFA_tf(settings):
     conf = config(settings)
     if conf['file']:
-        fdr1 = FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir'])
-        dca_data = fdr1.get_dca()
+        with FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir']) as fdr1:
+            dca_data = fdr1.get_dca()
+            if not conf['templates']:
+                dca_mcplots = fdr1.get_dca_mc()
     elif conf['data']:
         dca_data = conf['data']
     else:
         print('UFFA_tf: Missing input data!')
     if conf['templates']:
         if type(conf['templates']) == str:
-            fdr2 = FDR.FemtoDreamReader(conf['templates'], conf['mcTDir'])
-            dca_mcplots = fdr2.get_dca_mc()
+            with FDR.FemtoDreamReader(conf['templates'], conf['mcTDir']) as fdr2:
+                dca_mcplots = fdr2.get_dca_mc()
         else:
             dca_mcplots = conf['templates']
-    else:
-        dca_mcplots = fdr1.get_dca_mc()
 
     fds = FDS.FemtoDreamSaver(settings)
     ofile = fds.getFile()
 
+    import CombinedTemplateFit as TF       # only loaded for template fits
     TF.TemplateFit(ofile, dca_data, dca_mcplots, conf['tftype'], conf['namelist'], conf['fitrange'], conf['signalrange'], conf['bins'], conf['rebin'], conf['outDir'], conf['temp_init'], conf['temp_limits'], conf['temp_fraction'], conf['print'])
 
 # template fits 2d
@@ -61,120 +66,121 @@ def UFFA_tf2d(settings):
     fds = FDS.FemtoDreamSaver(settings)
     ofile = fds.getFile()
 
+    import CombinedTemplateFit as TF       # only loaded for template fits
     TF.TemplateFit2D(ofile, dca_data, dca_mcplots, conf['namelist'], conf['fitrange'], conf['signalrange'], conf['bins'], conf['rebin'], conf['outDir'], conf['temp_init'], conf['temp_limits'], conf['temp_fraction'], conf['print'], conf['debug'])
 
 # combined template fits
 def UFFA_ctf(settings):
     conf = config(settings)
     if conf['file']:
-        fdr1 = FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir'])
-        dca_data = fdr1.get_dca()
+        with FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir']) as fdr1:
+            dca_data = fdr1.get_dca()
+            if not conf['templates']:
+                dca_mcplots = fdr1.get_dca_mc()
     elif conf['data']:
         dca_data = conf['data']
     else:
         print('UFFA_tf: Missing input data!')
     if conf['templates']:
         if type(conf['templates']) == str:
-            fdr2 = FDR.FemtoDreamReader(conf['templates'], conf['mcTDir'])
-            dca_mcplots = fdr2.get_dca_mc()
+            with FDR.FemtoDreamReader(conf['templates'], conf['mcTDir']) as fdr2:
+                dca_mcplots = fdr2.get_dca_mc()
         else:
             dca_mcplots = conf['templates']
-    else:
-        dca_mcplots = fdr1.get_dca_mc()
 
     fds = FDS.FemtoDreamSaver(settings)
     ofile = fds.getFile()
 
+    import CombinedTemplateFit as TF       # only loaded for template fits
     TF.CombinedFit(ofile, conf['outDir'], dca_data, dca_mcplots, conf['namelist'], conf['fitrange'], conf['signalrange'], conf['bins'], conf['rebin'], conf['temp_init'], conf['temp_limits'], conf['temp_fraction'], conf['print'])
 
 # systematics
 def UFFA_syst(settings):
     conf = config(settings)
-    fdr = FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir'])
-
-    # default cf
-    ch = cf_handler(fdr, conf)
-    cf, cf_unw = ch.get_cf()                                # [[cf, [rebins]], [bin2...], ...], [[cf unw, [rebins]], [bin2...], ...]
-
-    # input same event for yield filtering
-    if conf['yield']:
-        se = fdr.get_se()
-        pair_num_se = se.Integral(se.FindBin(0), se.FindBin(conf['yield'][0]))
-    if conf['debug']:
-        se_all = ch.get_se()
-
-    cf_list = []
-    if conf['rebin']:
-        len_rebin = len(conf['rebin'])
-
-    if conf['atype'] == 'int':                              # integrated
-        ck, ck_rebin = cf[0]
-        cf_list.append([ck, ck_rebin])
-        syst = [[Systematics(ck), []]]                          # [[syst cf, [rebins]]]
+    with FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir']) as fdr:
+        # default cf
+        ch = cf_handler(fdr, conf)
+        cf, cf_unw = ch.get_cf()                                # [[cf, [rebins]], [bin2...], ...], [[cf unw, [rebins]], [bin2...], ...]
+
+        # input same event for yield filtering
+        if conf['yield']:
+            se = fdr.get_se()
+            pair_num_se = se.Integral(se.FindBin(0), se.FindBin(conf['yield'][0]))
+        if conf['debug']:
+            se_all = ch.get_se()
+
+        cf_list = []
         if conf['rebin']:
-            for i in range(len_rebin):
-                syst[0][1].append(Systematics(ck_rebin[i]))
-    elif conf['atype'] == 'dif':                            # differential
-        syst = []
-        for n, [ck, ck_rebin] in enumerate(cf):
+            len_rebin = len(conf['rebin'])
+
+        if conf['atype'] == 'int':                              # integrated
+            ck, ck_rebin = cf[0]
             cf_list.append([ck, ck_rebin])
-            syst.append([Systematics(ck), []])                  # [[syst cf, [rebins]], [bin2...], ...]
+            syst = [[Systematics(ck), []]]                          # [[syst cf, [rebins]]]
             if conf['rebin']:
                 for i in range(len_rebin):
-                    syst[n][1].append(Systematics(ck_rebin[i]))
-
-    # loop over data variations in file and calculate the cf for each
-    # which is then saved in a th2 from which the systematic error is computed and saved in a th1
-    file_dir = fdr.get_dir();
-    fdr.cd(0)           # class method of FileSaver to return to root of file
-    folders = fdr.get_folder_names()
-    for folder in folders:
-        fdr.cd(folder)
-
-        # allows to include/exclude specific variations
-        if conf['exclude'] and folder in conf['exclude']:
-            continue
-        elif conf['include']:
-            if folder in conf['include']:
-                pass
-            else:
+                    syst[0][1].append(Systematics(ck_rebin[i]))
+        elif conf['atype'] == 'dif':                            # differential
+            syst = []
+            for n, [ck, ck_rebin] in enumerate(cf):
+                cf_list.append([ck, ck_rebin])
+                syst.append([Systematics(ck), []])                  # [[syst cf, [rebins]], [bin2...], ...]
+                if conf['rebin']:
+                    for i in range(len_rebin):
+                        syst[n][1].append(Systematics(ck_rebin[i]))
+
+        # loop over data variations in file and calculate the cf for each
+        # which is then saved in a th2 from which the systematic error is computed and saved in a th1
+        file_dir = fdr.get_dir();
+        fdr.cd(0)           # class method of FileSaver to return to root of file
+        folders = fdr.get_folder_names()
+        for folder in folders:
+            fdr.cd(folder)
+
+            # allows to include/exclude specific variations
+            if conf['exclude'] and folder in conf['exclude']:
+                continue
+            elif conf['include']:
+                if folder in conf['include']:
+                    pass
+                else:
+                    continue
+            elif folder.rsplit('_')[-1][:3] != "Var":
                 continue
-        elif folder.rsplit('_')[-1][:3] != "Var":
-            continue
 
-        ch_var = cf_handler(fdr, conf)
-        cf_var, cf_var_unw = ch_var.get_cf()
+            ch_var = cf_handler(fdr, conf)
+            cf_var, cf_var_unw = ch_var.get_cf()
+
+            if conf['debug']:
+                print("Variation: \"" + folder + "\"")
+            if conf['yield']:
+                se_var = fdr.get_se()
+                pair_num_var = se_var.Integral(se_var.FindBin(0), se_var.FindBin(conf['yield'][0]))
+                deviation = abs(pair_num_se - pair_num_var) / pair_num_se
+                if deviation > conf['yield'][1]:
+                    if conf['debug']:
+                        dev = deviation * 100
+                        print("Integrated yield k*: [0, " + str(conf['yield'][0]) + ") differs by " + f"{dev:.1f} %")
+                        if deviation > conf['yield'][1]:
+                            print("Variation: Excluded!\n")
+                            continue
+            if conf['debug'] and conf['htype'] != 'k':
+                se_var_all = ch_var.get_se()
+                tab = '\t'
+                print("Differential yield:")
+                for n, bin1 in enumerate(se_var_all):
+                    yield_all = se_all[n][0].Integral()
+                    yield_all_var = se_var_all[n][0].Integral()
+                    deviation = (abs(yield_all - yield_all_var) / yield_all) * 100
+                    print(f"{tab}{conf['htype']:s}:  [{conf['bins'][n]:.2f}, {conf['bins'][n + 1]:.2f}) {tab} {deviation:5.2f} %")
+                print()
 
-        if conf['debug']:
-            print("Variation: \"" + folder + "\"")
-        if conf['yield']:
-            se_var = fdr.get_se()
-            pair_num_var = se_var.Integral(se_var.FindBin(0), se_var.FindBin(conf['yield'][0]))
-            deviation = abs(pair_num_se - pair_num_var) / pair_num_se
-            if deviation > conf['yield'][1]:
-                if conf['debug']:
-                    dev = deviation * 100
-                    print("Integrated yield k*: [0, " + str(conf['yield'][0]) + ") differs by " + f"{dev:.1f} %")
-                    if deviation > conf['yield'][1]:
-                        print("Variation: Excluded!\n")
-                        continue
-        if conf['debug'] and conf['htype'] != 'k':
-            se_var_all = ch_var.get_se()
-            tab = '\t'
-            print("Differential yield:")
-            for n, bin1 in enumerate(se_var_all):
-                yield_all = se_all[n][0].Integral()
-                yield_all_var = se_var_all[n][0].Integral()
-                deviation = (abs(yield_all - yield_all_var) / yield_all) * 100
-                print(f"{tab}{conf['htype']:s}:  [{conf['bins'][n]:.2f}, {conf['bins'][n + 1]:.2f}) {tab} {deviation:5.2f} %")
-            print()
-
-        for n, [ck_var, ck_var_rebin] in enumerate(cf_var):
-            syst[n][0].AddVar(ck_var)
-            if conf['rebin']:
-                for i in range(len_rebin):
-                    syst[n][1][i].AddVar(ck_var_rebin[i])
-        del ch_var
+            for n, [ck_var, ck_var_rebin] in enumerate(cf_var):
+                syst[n][0].AddVar(ck_var)
+                if conf['rebin']:
+                    for i in range(len_rebin):
+                        syst[n][1][i].AddVar(ck_var_rebin[i])
+            del ch_var
 
     # generate th2 plots for systematics
     for n in range(len(syst)):
@@ -193,18 +199,10 @@ def UFFA_syst(settings):
     # generates the graphs with the systematic errors for the cf and the rebinned entries
     tgraphs = []
     for n, (hist, hist_rebin) in enumerate(cf_list):
-        tgraphs.append([ROOT.TGraphErrors(), []])
-        for i in range(1, hist.GetNbinsX() + 1):
-            tgraphs[n][0].SetName("CF_syst_graph")
-            tgraphs[n][0].SetPoint(i - 1, hist.GetBinCenter(i), hist.GetBinContent(i))
-            tgraphs[n][0].SetPointError(i - 1, 0, syst_plots[n][0][2].GetBinContent(i))
+        tgraphs.append([getSystGraph(hist, syst_plots[n][0][2], "CF_syst_graph"), []])
         if conf['rebin']:
             for i in range(len_rebin):
-                tgraphs[n][1].append(ROOT.TGraphErrors())
-                for j in range(1, hist.GetNbinsX() + 1):
-                    tgraphs[n][1][i].SetName("CF_syst_graph")
-                    tgraphs[n][1][i].SetPoint(j - 1, hist_rebin[i].GetBinCenter(j), hist_rebin[i].GetBinContent(j))
-                    tgraphs[n][1][i].SetPointError(j - 1, 0, syst_plots[n][1][i][2].GetBinContent(j))
+                tgraphs[n][1].append(getSystGraph(hist_rebin[i], syst_plots[n][1][i][2], "CF_syst_graph"))
 
     histos = (cf_list, syst_plots, tgraphs)
     fds = FDS.FemtoDreamSaver(conf, histos)
@@ -212,102 +210,101 @@ def UFFA_syst(settings):
 # systematics
 def UFFA_syst_3d(settings):
     conf = config(settings)
-    fdr = FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir'])
-
-    # default cf
-    ch = cf_handler(fdr, conf)
-    histos = ch.get_cf_3d()                                # [[cf, [rebins]], [bin2...], ...], [[cf unw, [rebins]], [bin2...], ...]
-
-    # input same event for yield filtering
-    if conf['yield']:
-        se = fdr.get_se()
-        pair_num_se = se.Integral(se.FindBin(0), se.FindBin(conf['yield'][0]))
-    if conf['debug']:
-        se_all = ch.get_se_3d()
-
-    syst = []
-    syst_plots = []
-    cf_raw = []
+    with FDR.FemtoDreamReader(conf['fullpath'], conf['fileTDir']) as fdr:
+        # default cf
+        ch = cf_handler(fdr, conf)
+        histos = ch.get_cf_3d()                                # [[cf, [rebins]], [bin2...], ...], [[cf unw, [rebins]], [bin2...], ...]
 
-    if conf['rebin']:
-        len_rebin = len(conf['rebin'])
-
-    # create systematic object for all entries
-    for n, bin1 in enumerate(histos):
-        syst.append([])
-        for nn, [cf, cf_rebin] in enumerate(bin1):
-            syst[n].append([Systematics(cf), []])
-            if conf['rebin']:
-                for nnn in range(len_rebin):
-                    syst[n][nn][1].append(Systematics(cf_rebin[nnn]))
-
-    # loop over data variations in file and calculate the cf for each
-    # which is then saved in a th2 from which the systematic error is computed and saved in a th1
-    file_dir = fdr.get_dir();
-    fdr.cd(0)                               # class method of FileSaver to return to root of file
-    folders = fdr.get_folder_names()
-    folder_counter = -1
-    for folder in folders:
-        fdr.cd(folder)
-
-        # include/exclude specific variations
-        if conf['exclude'] and folder in conf['exclude']:
-            continue
-        elif conf['include']:
-            if folder in conf['include']:
-                pass
-            else:
-                continue
-        elif folder.rsplit('_')[-1][:3] != "Var":
-            continue
-
-        ch_var = cf_handler(fdr, conf)
-        histos_var = ch_var.get_cf_3d()
-
-        if conf['debug']:
-            print("Variation: \"" + folder + "\"")
-        # compare integrated yields in given range
+        # input same event for yield filtering
         if conf['yield']:
-            se_var = fdr.get_se()
-            pair_num_var = se_var.Integral(se_var.FindBin(0), se_var.FindBin(conf['yield'][0]))
-            deviation = abs(pair_num_se - pair_num_var) / pair_num_se
-            if deviation > conf['yield'][1]:
-                if conf['debug']:
-                    dev = deviation * 100
-                    print("Integrated yield k*: [0, " + str(conf['yield'][0]) + ") differs by " + f"{dev:.1f} %")
-                    if deviation > conf['yield'][1]:
-                        print("Variation: Excluded!\n")
-                        continue
+            se = fdr.get_se()
+            pair_num_se = se.Integral(se.FindBin(0), se.FindBin(conf['yield'][0]))
         if conf['debug']:
-            se_var_all = ch_var.get_se_3d()
-            tab = '\t'
-            for n, bin1 in enumerate(se_var_all):
-                print(f"Differential yield {conf['diff3d']:s}: [{conf['bins3d'][n]:.2f}, {conf['bins3d'][n + 1]:.2f})")
-                for nn, bin2 in enumerate(bin1):
-                    yield_all = se_all[n][nn][0].Integral()
-                    yield_all_var = se_var_all[n][nn][0].Integral()
-                    deviation = (abs(yield_all - yield_all_var) / yield_all) * 100
-                    print(f"{tab}{conf['diff3d2']:s}:  [{conf['bins'][nn]:.2f}, {conf['bins'][nn + 1]:.2f}) {tab} {deviation:5.2f} %")
-                print()
-            if conf['interactive']:
-                option = input("Include [Y/n] ")
-                if option and option.lower()[0] == 'n':
-                    print("\"" + folder + "\" excluded!\n")
-                    continue
-        folder_counter += 1
+            se_all = ch.get_se_3d()
 
-        cf_raw.append([])   # add entry for folder
-        # add rebinned variations
-        for n, bin1 in enumerate(histos_var):
-            cf_raw[folder_counter].append([])
+        syst = []
+        syst_plots = []
+        cf_raw = []
+
+        if conf['rebin']:
+            len_rebin = len(conf['rebin'])
+
+        # create systematic object for all entries
+        for n, bin1 in enumerate(histos):
+            syst.append([])
             for nn, [cf, cf_rebin] in enumerate(bin1):
-                cf_raw[folder_counter][n].append([cf.Clone("CF_" + folder.rsplit('_')[-1]), []])
-                syst[n][nn][0].AddVar(cf)
+                syst[n].append([Systematics(cf), []])
                 if conf['rebin']:
                     for nnn in range(len_rebin):
-                        cf_raw[folder_counter][n][nn][1].append(cf_rebin[nnn].Clone("CF_" + folder.rsplit('_')[-1]))
-                        syst[n][nn][1][nnn].AddVar(cf_rebin[nnn])
-        del ch_var
+                        syst[n][nn][1].append(Systematics(cf_rebin[nnn]))
+
+        # loop over data variations in file and calculate the cf for each
+        # which is then saved in a th2 from which the systematic error is computed and saved in a th1
+        file_dir = fdr.get_dir();
+        fdr.cd(0)                               # class method of FileSaver to return to root of file
+        folders = fdr.get_folder_names()
+        folder_counter = -1
+        for folder in folders:
+            fdr.cd(folder)
+
+            # include/exclude specific variations
+            if conf['exclude'] and folder in conf['exclude']:
+                continue
+            elif conf['include']:
+                if folder in conf['include']:
+                    pass
+                else:
+                    continue
+            elif folder.rsplit('_')[-1][:3] != "Var":
+                continue
+
+            ch_var = cf_handler(fdr, conf)
+            histos_var = ch_var.get_cf_3d()
+
+            if conf['debug']:
+                print("Variation: \"" + folder + "\"")
+            # compare integrated yields in given range
+            if conf['yield']:
+                se_var = fdr.get_se()
+                pair_num_var = se_var.Integral(se_var.FindBin(0), se_var.FindBin(conf['yield'][0]))
+                deviation = abs(pair_num_se - pair_num_var) / pair_num_se
+                if deviation > conf['yield'][1]:
+                    if conf['debug']:
+                        dev = deviation * 100
+                        print("Integrated yield k*: [0, " + str(conf['yield'][0]) + ") differs by " + f"{dev:.1f} %")
+                        if deviation > conf['yield'][1]:
+                            print("Variation: Excluded!\n")
+                            continue
+            if conf['debug']:
+                se_var_all = ch_var.get_se_3d()
+                tab = '\t'
+                for n, bin1 in enumerate(se_var_all):
+                    print(f"Differential yield {conf['diff3d']:s}: [{conf['bins3d'][n]:.2f}, {conf['bins3d'][n + 1]:.2f})")
+                    for nn, bin2 in enumerate(bin1):
+                        yield_all = se_all[n][nn][0].Integral()
+                        yield_all_var = se_var_all[n][nn][0].Integral()
+                        deviation = (abs(yield_all - yield_all_var) / yield_all) * 100
+                        print(f"{tab}{conf['diff3d2']:s}:  [{conf['bins'][nn]:.2f}, {conf['bins'][nn + 1]:.2f}) {tab} {deviation:5.2f} %")
+                    print()
+                if conf['interactive']:
+                    option = input("Include [Y/n] ")
+                    if option and option.lower()[0] == 'n':
+                        print("\"" + folder + "\" excluded!\n")
+                        continue
+            folder_counter += 1
+
+            cf_raw.append([])   # add entry for folder
+            # add rebinned variations
+            for n, bin1 in enumerate(histos_var):
+                cf_raw[folder_counter].append([])
+                for nn, [cf, cf_rebin] in enumerate(bin1):
+                    cf_raw[folder_counter][n].append([cf.Clone("CF_" + folder.rsplit('_')[-1]), []])
+                    syst[n][nn][0].AddVar(cf)
+                    if conf['rebin']:
+                        for nnn in range(len_rebin):
+                            cf_raw[folder_counter][n][nn][1].append(cf_rebin[nnn].Clone("CF_" + folder.rsplit('_')[-1]))
+                            syst[n][nn][1][nnn].AddVar(cf_rebin[nnn])
+            del ch_var
 
     # generate th2 plots for systematics
     for n, bin1 in enumerate(syst):
@@ -325,18 +322,10 @@ def UFFA_syst_3d(settings):
     for n, bin1 in enumerate(histos):
         tgraphs.append([])
         for nn, [hist, hist_rebin] in enumerate(bin1):
-            tgraphs[n].append([ROOT.TGraphErrors(), []])
-            for nnn in range(1, hist.GetNbinsX() + 1):
-                tgraphs[n][nn][0].SetName("CF syst graph")
-                tgraphs[n][nn][0].SetPoint(nnn - 1, hist.GetBinCenter(nnn), hist.GetBinContent(nnn))
-                tgraphs[n][nn][0].SetPointError(nnn - 1, 0, syst_plots[n][nn][0][2].GetBinContent(nnn))
+            tgraphs[n].append([getSystGraph(hist, syst_plots[n][nn][0][2], "CF syst graph"), []])
             if conf['rebin']:
                 for nnn in range(len_rebin):
-                    tgraphs[n][nn][1].append(ROOT.TGraphErrors())
-                    for nnnn in range(1, hist.GetNbinsX() + 1):
-                        tgraphs[n][nn][1][nnn].SetName("CF syst graph")
-                        tgraphs[n][nn][1][nnn].SetPoint(nnnn - 1, hist_rebin[nnn].GetBinCenter(nnnn), hist_rebin[nnn].GetBinContent(nnnn))
-                        tgraphs[n][nn][1][nnn].SetPointError(nnnn - 1, 0, syst_plots[n][nn][1][nnn][2].GetBinContent(nnnn))
+                    tgraphs[n][nn][1].append(getSystGraph(hist_rebin[nnn], syst_plots[n][nn][1][nnn][2], "CF syst graph"))
 
     all_histos = (histos, syst_plots, tgraphs, cf_raw)
     fds = FDS.FemtoDreamSaver(conf, all_histos)
@@ -345,41 +334,69 @@ def UFFA_syst_3d(settings):
 # add variations with AddVar(var) before calling GenSyst()
 # GetAll() returns [th2 cf, th2 difference, th1 systematics, th1 std dev]
 class Systematics():
+    __slots__ = ('_cf', '_xaxis', '_xbins', '_centers', '_ncols', '_var', '_dif', '_sys', '_dev')
     counter = 0
     ybins = 1200
     def __init__(self, cf):
         self._cf = cf
         self._xaxis = cf.GetXaxis()
         self._xbins = cf.GetNbinsX()
+        self._centers = HU.get_bin_centers(self._xaxis)
+        self._ncols = int(np.count_nonzero(self._centers <= 3))                 # no systematics over 3GeV
 
         self._var = ROOT.TH2D("CF_th2", "CF_th2", self._xbins, self._xaxis.GetXmin(), self._xaxis.GetXmax(), Systematics.ybins, 0, 10)
         self._dif = ROOT.TH2D("diff_th2", "diff_th2", self._xbins, self._xaxis.GetXmin(), self._xaxis.GetXmax(), Systematics.ybins, -5, 5)
+        self._var.Sumw2(ROOT.kFALSE)                                             # only counts, no errors needed
+        self._dif.Sumw2(ROOT.kFALSE)
         self._sys = ROOT.TH1D("syst_th1", "syst_th1", self._xbins, self._xaxis.GetXmin(), self._xaxis.GetXmax())
         self._dev = ROOT.TH1D("dev_th1", "dev_th1", self._xbins, self._xaxis.GetXmin(), self._xaxis.GetXmax())
         Systematics.counter = Systematics.counter + 1
 
     def AddVar(self, cf_var):
-        for i in range(1, self._xbins + 1):
-            if self._cf.GetBinCenter(i) > 3:    # break over 3GeV
-                break
-            self._var.Fill(cf_var.GetBinCenter(i), cf_var.GetBinContent(i))     # fill th2 cf histo with variation
+        if not self._ncols:                                     # no bins in the systematics range, nothing to fill
+            return
+        cont = HU.get_content(cf_var)[1:self._ncols + 1]
+        self._var.FillN(self._ncols, self._centers[:self._ncols], cont, np.ones(self._ncols))   # fill th2 cf histo with variation
 
     def GenSyst(self):
-        for i in range(1, self._xbins + 1):
-            if self._cf.GetBinCenter(i) > 3:    # break over 3GeV
-                break
-            cf_proj = self._var.ProjectionY("cf_xbin" + str(i), i, i)
-            dev = cf_proj.GetStdDev()
-            self._dev.SetBinContent(i, dev)
-            cont_def = self._cf.GetBinContent(i)
-            var_min = cf_proj.GetBinCenter(cf_proj.FindFirstBinAbove(0))
-            var_max = cf_proj.GetBinCenter(cf_proj.FindLastBinAbove(0))
-            self._dif.SetBinContent(i, self._dif.GetYaxis().FindBin(var_min), 1)
-            self._dif.SetBinContent(i, self._dif.GetYaxis().FindBin(var_max), 1)
-            dif_proj = self._dif.ProjectionY("diff_xbin" + str(i), i, i)
-            proj_min = dif_proj.GetBinCenter(dif_proj.FindFirstBinAbove(0))     # minimum value of difference
-            proj_max = dif_proj.GetBinCenter(dif_proj.FindLastBinAbove(0))      # maximum value of difference
-            self._sys.SetBinContent(i, (proj_max - proj_min) / (12**0.5))       # assume a square distribution
+        ybins = self._var.GetNbinsY()
+        dif_axis = self._dif.GetYaxis()
+        ndif = dif_axis.GetNbins()
+        ncols = self._ncols
+        var = HU.get_content(self._var).reshape(ybins + 2, self._xbins + 2)[1:-1, 1:ncols + 1]
+        filled = var > 0
+        cols = np.flatnonzero(filled.any(axis = 0))                             # bins with at least one variation
+        var = var[:, cols]
+        filled = filled[:, cols]
+
+        # std dev of the variations per bin
+        ycenters = HU.get_bin_centers(self._var.GetYaxis())
+        sumw = var.sum(axis = 0)
+        mean = (var * ycenters[:, None]).sum(axis = 0) / sumw
+        dev = np.sqrt(np.abs((var * ycenters[:, None]**2).sum(axis = 0) / sumw - mean**2))
+
+        # minimum and maximum variation per bin
+        var_min = ycenters[filled.argmax(axis = 0)]
+        var_max = ycenters[ybins - 1 - filled[::-1].argmax(axis = 0)]
+        bin_min = HU.find_bins(dif_axis, var_min)
+        bin_max = HU.find_bins(dif_axis, var_max)
+        dif = HU.get_content(self._dif).reshape(ndif + 2, self._xbins + 2)
+        dif[bin_min, cols + 1] = 1
+        dif[bin_max, cols + 1] = 1
+
+        # difference of the extremes, assume a square distribution
+        dif_centers = HU.get_bin_centers(dif_axis)
+        proj_min = dif_centers[np.clip(bin_min, 1, ndif) - 1]
+        proj_max = dif_centers[np.clip(bin_max, 1, ndif) - 1]
+        syst = np.where(bin_max <= ndif, proj_max - proj_min, 0) * _INV_SQRT12
+
+        sys_cont = np.zeros(self._xbins + 2)
+        dev_cont = np.zeros(self._xbins + 2)
+        sys_cont[cols + 1] = syst
+        dev_cont[cols + 1] = dev
+        HU.set_content(self._dif, dif)
+        HU.set_content(self._sys, sys_cont)
+        HU.set_content(self._dev, dev_cont)
         self._var.SetDirectory(0)
         self._dif.SetDirectory(0)
         self._sys.SetDirectory(0)
@@ -428,6 +445,9 @@ class cf_handler():
         self._tracks = None
         self._tracks_mc = None
         self._v0 = None
+        self._qa_read = False                   # event and track qa histos already read
+        self._histos = None                     # cached output of getIntegrated/getDifferential
+        self._histos_3d = None                  # cached output of getDifferential3D/getDiffReweight3D
         self._get_histos()
 
     # retrieves histos from the provided file reader
@@ -471,6 +491,11 @@ class cf_handler():
         if self._name_me and not self._name_se:
             self._me = self._file.get_histo(self._name_me)
 
+    # retrieves the event and track qa histos only once, only needed for saving the full output
+    def _get_qa_histos(self):
+        if self._qa_read:
+            return
+        self._qa_read = True
         if self._mc:
             self._tracks_mc = self._file.get_tracks_mc()
         if self._pair == 'pp':
@@ -479,31 +504,48 @@ class cf_handler():
         elif self._pair == 'pl':
             self._v0 = self._file.get_v0()
 
+    # computes the se, me and cf of the integrated or differential analysis only once
+    # and returns [histos, histos_unw]
+    def _get_cf_histos(self):
+        if not self._histos:
+            if self._atype == 'int':
+                self._histos = getIntegrated(self._se, self._me, self._htype, self._rebin, self._norm, self._rew_range)
+            elif self._atype == 'dif':
+                self._histos = [getDifferential(self._se, self._me, self._htype, self._bins, self._rebin, self._norm), []]
+        return self._histos
+
+    # computes the se, me and cf of the 3D differential analysis only once
+    def _get_3d_histos(self):
+        if not self._histos_3d:
+            se = self._se
+            me = self._me
+            if self._htype in ['4d', 'rew4d']:
+                se, me = getProj4d(self._se, self._me, self._perc)
+
+            if self._htype in ['rew3d', 'rew4d']:
+                self._histos_3d = getDiffReweight3D(se, me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm, self._rew_range)
+            else:
+                self._histos_3d = [getDifferential3D(se, me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm), []]
+        return self._histos_3d
+
     # computes the cf for integrated or differential analysis and for mc data
     # and returns the histos for all the different options
     # [histos, histos_unw, histos_mc, histos_unw_mc, self._event, self._tracks, self._tracks_mc]
     def get_histos(self):
+        self._get_qa_histos()
         histos = []
         histos_mc = []
         histos_unw = []
         histos_unw_mc = []
         if self._atype == 'int':        # integrated analysis
-            histos, histos_unw = getIntegrated(self._se, self._me, self._htype, self._rebin, self._norm, self._rew_range)
+            histos, histos_unw = self._get_cf_histos()
             if self._mc:
                 histos_mc, histos_unw_mc = getIntegrated(self._se_mc, self._me_mc, self._htype, self._rebin, self._norm, self._rew_range)
         elif self._atype == 'dif':      # differential analysis
-            if self._htype == 'mtmult': # 3D differantial analysis
-                histos = getDifferential3D(self._se, self._me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm)
-            elif self._htype == 'rew3d':
-                histos, histos_unw = getDiffReweight3D(self._se, self._me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm, self._rew_range)
-            elif self._htype in ['4d', 'rew4d']:
-                se3d, me3d = getProj4d(self._se, self._me, self._perc)
-                if self._htype == '4d':
-                    histos = getDifferential3D(se3d, me3d, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm)
-                else:
-                    histos, histos_unw = getDiffReweight3D(se3d, me3d, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm, self._rew_range)
+            if self._htype in ['mtmult', 'rew3d', '4d', 'rew4d']: # 3D differantial analysis
+                histos, histos_unw = self._get_3d_histos()
             else:
-                histos = getDifferential(self._se, self._me, self._htype, self._bins, self._rebin, self._norm)
+                histos, histos_unw = self._get_cf_histos()
                 if self._mc:
                     histos_mc = getDifferential(self._se_mc, self._me_mc, self._htype, self._bins, self._rebin, self._norm)
 
@@ -512,20 +554,14 @@ class cf_handler():
     # returns a list of cf and their rebinned version
     # [[cf, [rebin 1, rebin 2, ...]], [bin2...], ...] same for unweighted if integrated analysis
     def get_cf(self):
-        histos = []
-        histos_unw = []
         cf_list = []
         cf_list_unw = []
 
+        histos, histos_unw = self._get_cf_histos()
         # integrated analysis
-        if self._atype == 'int':
-            histos, histos_unw = getIntegrated(self._se, self._me, self._htype, self._rebin, self._norm)
-            if self._htype == 'mult':
-                cf_list_unw.append(histos_unw[1])
-                cf_list_unw.append([])
-        # differential analysis
-        elif self._atype == 'dif':
-            histos = getDifferential(self._se, self._me, self._htype, self._bins, self._rebin, self._norm)
+        if self._atype == 'int' and self._htype == 'mult':
+            cf_list_unw.append(histos_unw[1])
+            cf_list_unw.append([])
         cf_list.append([histos[1][2], []])                          # cf, for differential 1st bin
 
         # rebinned entries appended to the empty list for the first bin
@@ -541,20 +577,14 @@ class cf_handler():
                 cf_list.append([histos[n][2], []])
                 if self._rebin:
                     for nn in range(len(self._rebin)):
-                        cf_list[n][1].append(histos[n][3][nn][2])    # rebinned cf appended to rebin list
+                        cf_list[n - 1][1].append(histos[n][3][nn][2])    # rebinned cf appended to rebin list
         return [cf_list, cf_list_unw]
 
     # returns a list of se and their rebinned version
     def get_se(self):
-        histos = []
         se_list = []
 
-        # integrated analysis
-        if self._atype == 'int':
-            histos, histos_unw = getIntegrated(self._se, self._me, self._htype, self._rebin, self._norm)
-        # differential analysis
-        elif self._atype == 'dif':
-            histos = getDifferential(self._se, self._me, self._htype, self._bins, self._rebin, self._norm)
+        histos = self._get_cf_histos()[0]
         se_list.append([histos[1][0], []])                          # se for differential 1st bin
 
         # rebinned entries appended to the empty list for the first bin
@@ -564,11 +594,11 @@ class cf_handler():
 
         # repeat for the rest of the bins in case of differential analysis
         if self._atype == 'dif':
-            for n in range(1, len(self._bins) - 1):
+            for n in range(2, len(self._bins)):
                 se_list.append([histos[n][0], []])
                 if self._rebin:
                     for nn in range(len(self._rebin)):
-                        se_list[n][1].append(histos[n][3][nn][0])    # rebinned se appended to rebin list
+                        se_list[n - 1][1].append(histos[n][3][nn][0])    # rebinned se appended to rebin list
         return se_list
 
     # returns all the cf's for a 3D mt/mult histo
@@ -576,16 +606,7 @@ class cf_handler():
     def get_cf_3d(self):
         cf_list = []
 
-        se = self._se
-        me = self._me
-        if self._htype in ['4d', 'rew4d']:
-            se, me = getProj4d(self._se, self._me, self._perc)
-
-        if self._htype in ['rew3d', 'rew4d']:
-            histos, histos_unw = getDiffReweight3D(se, me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm, self._rew_range)
-        else:
-            histos = getDifferential3D(se, me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm)
-
+        histos = self._get_3d_histos()[0]
         histos = histos[1:]     # remove TH3 histos
         for n, bin1 in enumerate(histos):
             cf_list.append([])
@@ -602,16 +623,7 @@ class cf_handler():
     def get_se_3d(self):
         se_list = []
 
-        se = self._se
-        me = self._me
-        if self._htype in ['4d', 'rew4d']:
-            se, me = getProj4d(self._se, self._me, self._perc)
-
-        if self._htype in ['rew3d', 'rew4d']:
-            histos, histos_unw = getDiffReweight3D(se, me, self._diff3d, self._bins3d, self.bins, self._rebin, self._nrm, self._rew_range)
-        else:
-            histos = getDifferential3D(se, me, self._diff3d, self._bins3d, self._bins, self._rebin, self._norm)
-
+        histos = self._get_3d_histos()[0]
         histos = histos[1:]     # remove TH3 histos
         for n, bin1 in enumerate(histos):
             se_list.append([])
@@ -655,6 +667,12 @@ def getBinRangeHistos(iSE, iME, bins):
 
     return histos
 
+# axis to split and projection option of the remaining axes for each 'diff3d' option
+_DIFF3D_PROJ = {
+        'mt':   (lambda hist: hist.GetYaxis(), "zx"),
+        'mult': (lambda hist: hist.GetZaxis(), "yx"),
+    }
+
 # splits th3 in section based on provided bins
 def getBinRangeHistos3D(iSE, iME, diff3d, bins3d):
     """
@@ -666,17 +684,12 @@ def getBinRangeHistos3D(iSE, iME, diff3d, bins3d):
         [[name, SE, ME], [bin2], ...]
     where the name is a string containing the limits and SE, ME are 2D plots.
     """
-    if diff3d == 'mt':
-        diffAxisSE = iSE.GetYaxis()
-        diffAxisME = iME.GetYaxis()
-        projOpt = "zx"
-    elif diff3d == 'mult':
-        diffAxisSE = iSE.GetZaxis()
-        diffAxisME = iME.GetZaxis()
-        projOpt = "yx"
-    else:
+    if diff3d not in _DIFF3D_PROJ:
         print("Error in getBinRangeHistos: diff3d axis not known. Please choose either 'mt' or 'mult'")
         exit()
+    get_axis, projOpt = _DIFF3D_PROJ[diff3d]
+    diffAxisSE = get_axis(iSE)
+    diffAxisME = get_axis(iME)
 
     if type(bins3d) == list:
         limits = []
@@ -707,9 +720,12 @@ def getCorrelation(se, me, name, conf, norm = None):
     ch.make_cf()
     minmax = norm if norm else [0.24, 0.34]
     ch.normalize_cf(minmax[0], minmax[1])
-    se = ch.get_se().Clone("SE")
-    me = ch.get_me().Clone("ME")
-    cf = ch.get_cf().Clone("CF")
+    se = ch.get_se()        # handler histos are already private copies
+    me = ch.get_me()
+    cf = ch.get_cf()
+    se.SetName("SE")
+    me.SetName("ME")
+    cf.SetName("CF")
     se.SetTitle(conf)
     me.SetTitle(conf)
     cf.SetTitle(conf)
@@ -835,8 +851,10 @@ def getIntegrated(iSE, iME, htype, rebin, norm, rew_range):
         histos[1].append(histos_rebin)
     if htype == 'mult':      # 2nd list with unweighted histos
         se, me, cf = getCorrelation(se, me_unw, "cf_unw", "unweighted", norm)
-        histos_unw.append(me.Clone("ME_unw"))
-        histos_unw.append(cf.Clone("CF unw"))
+        me.SetName("ME_unw")            # getCorrelation returns private copies, no need to clone
+        cf.SetName("CF unw")
+        histos_unw.append(me)
+        histos_unw.append(cf)
         histos_unw.append([])
         if rebin:           # append rebinned histos to list of histos
             histos_rebin = []
@@ -845,7 +863,9 @@ def getIntegrated(iSE, iME, htype, rebin, norm, rew_range):
                 me_rebin = rebin_hist(me, factor)
                 rebin_conf = " rebin: " + str(factor)
                 se_rebin, me_rebin, cf_rebin = getCorrelation(se_rebin, me_rebin, "rebin: " + str(factor), rebin_conf, norm)
-                histos_unw[2].append([me_rebin.Clone("ME_unw"), cf_rebin.Clone("CF_unw")])
+                me_rebin.SetName("ME_unw")
+                cf_rebin.SetName("CF_unw")
+                histos_unw[2].append([me_rebin, cf_rebin])
 
     return histos, histos_unw
 
@@ -868,7 +888,6 @@ def reweight(iSE, iME, rew_range):
 
     me = iME.Clone("ME_kmult_reweighted")
     me.Reset("ICESM")
-    me_axis = me.GetYaxis()
 
     se_k = iSE.ProjectionX("se_k")
     me_k = iME.ProjectionX("me_k")
@@ -877,7 +896,7 @@ def reweight(iSE, iME, rew_range):
     int_max = se_k.GetNbinsX()
     if rew_range:
         int_min = se_k.FindBin(rew_range[0])
-        int_max = se_k.FindBin(FU.get_bin_reduce_on_lower_edge(iME.GetXaxis(), rew_range[1]))
+        int_max = FU.find_bin_reduce_on_lower_edge(se_k.GetXaxis(), rew_range[1])
 
     se_mult = iSE.ProjectionY("se_mult")
     me_mult = iME.ProjectionY("me_mult")
@@ -888,22 +907,30 @@ def reweight(iSE, iME, rew_range):
     me_k.Reset("ICESM")
     me_mult.Reset("ICESM")
 
-    # loop for the projection of each multiplicity slice
-    for ybin in range(1, iSE.GetNbinsY()):
-        se_n = iSE.ProjectionX("se_bin", ybin, ybin)
-        me_n = iME.ProjectionX("me_bin", ybin, ybin)
-
-        se_int = se_n.Integral(int_min, int_max)
-        me_int = me_n.Integral(int_min, int_max)
-
-        if me_int > 0. and se_int > 0.:
-            me_n.Scale(se_int / me_int)
-            me_mult.SetBinContent(ybin, me_n.Integral(int_min, int_max))
-            me_k.Add(me_n)
-            for xbin in range(1, me_n.GetNbinsX() + 1):        # fill th2 reweighted ME
-                #me.Fill(me_n.GetBinContent(xbin), me_axis.GetBinCenter(ybin))
-                #me.Fill(me_axis.GetBinCenter(ybin), me_n.GetBinContent(xbin))
-                me.SetBinContent(xbin, ybin, me_n.GetBinContent(xbin))
+    # reweight each multiplicity slice at once on the [ybin, xbin] arrays of the th2's
+    xbins = iSE.GetNbinsX()
+    ybins = iSE.GetNbinsY()
+    se_arr = HU.get_content(iSE).reshape(ybins + 2, xbins + 2)
+    me_arr = HU.get_content(iME).reshape(ybins + 2, xbins + 2)
+    me_err2 = HU.get_errors2(iME).reshape(ybins + 2, xbins + 2)
+    rows = slice(1, ybins + 1)
+    se_int = se_arr[rows, int_min:int_max + 1].sum(axis = 1)
+    me_int = me_arr[rows, int_min:int_max + 1].sum(axis = 1)
+    active = np.flatnonzero((me_int > 0.) & (se_int > 0.)) + 1     # th2 rows with entries in SE and ME, empty rows stay reset
+
+    scale = np.zeros(ybins + 2)
+    scale[active] = se_int[active - 1] / me_int[active - 1]
+    me_rw = np.zeros_like(me_arr)
+    me_rw[active] = me_arr[active] * scale[active, None]
+
+    me_cont = np.zeros_like(me_rw)
+    me_cont[:, 1:xbins + 1] = me_rw[:, 1:xbins + 1]                # fill th2 reweighted ME
+    HU.set_content(me, me_cont)
+    HU.set_content(me_k, me_rw[active].sum(axis = 0))
+    me_k.SetError(np.sqrt((me_err2[active] * scale[active, None]**2).sum(axis = 0)))
+    me_mult_cont = np.zeros(ybins + 2)
+    me_mult_cont[active] = me_rw[active, int_min:int_max + 1].sum(axis = 1)
+    HU.set_content(me_mult, me_mult_cont)
 
     return [se_k, me_k, me_k_unw, me, se_mult, me_mult, me_mult_unw]
 
@@ -922,7 +949,9 @@ def reweight3D(iSE, iME, diff3d, bins3d, rew_range):
     out = []
 
     for hist in histos:
-        out.append([hist[0], hist[1], reweight(hist[1], hist[2], rew_range)[3].Clone(hist[0])])        # append the reweighted th2 ME distribution
+        me = reweight(hist[1], hist[2], rew_range)[3]        # reweighted th2 ME distribution, a new histo for every call
+        me.SetName(hist[0])
+        out.append([hist[0], hist[1], me])
 
     return out
 
@@ -943,6 +972,16 @@ def getProj4d(iSE, iME, perc_range):
 
     return [se, me]
 
+# returns a TGraphErrors with the bin contents of 'hist' and the systematic errors of 'syst' as y-errors
+def getSystGraph(hist, syst, name):
+    nbins = hist.GetNbinsX()
+    x = HU.get_bin_centers(hist.GetXaxis())
+    y = HU.get_content(hist)[1:nbins + 1]
+    ey = HU.get_content(syst)[1:nbins + 1]
+    graph = ROOT.TGraphErrors(nbins, x, y, np.zeros(nbins), ey)
+    graph.SetName(name)
+    return graph
+
 # returns rebinned copy of histo
 def rebin_hist(input_histo, binning):
     histo = input_histo.Clone()
@@ -959,6 +998,85 @@ def bin2list(rebin):
     rebin_list.extend(rebin)
     return rebin_list
 
+# settings dictionary skeleton, all values are immutable so a shallow copy is enough
+_CONFIG_DEFAULTS = {
+        "function":         None,
+        "pair":             None,
+        "path":             "",
+        "file":             None,
+        "fullpath":         None,
+        "fileTDir":         "",
+        "nameSE":           "",
+        "nameME":           "",
+        "newfile":          None,
+        "mc":               None,
+        "mcTDir":           "",
+        "outDir":           "",
+        "rename":           None,
+        "bins":             None,
+        "bins3d":           None,
+        "diff3d":           "",
+        "diff3d2":          "",
+        "yield":            None,
+        "rebin":            None,
+        "atype":            None,
+        "htype":            None,
+        "tftype":           None,
+        "data":             None,
+        "templates":        None,
+        "temp_init":        None,
+        "temp_limits":      None,
+        "temp_fraction":    None,
+        "namelist":         None,
+        "fitrange":         None,
+        "signalrange":      None,
+        "percentile":       None,
+        "rewrange":         None,
+        "normalize":        None,
+        "include":          None,
+        "exclude":          None,
+        "debug":            False,
+        "print":            False,
+        "interactive":      False,
+    }
+
+# accepted aliases of the analysis type, histogram type and 3D split axis
+_ATYPE_KEYS = {
+        'int':          'int',
+        'integrated':   'int',
+        'diff':         'dif',
+        'dif':          'dif',
+        'differential': 'dif',
+    }
+_HTYPE_KEYS = {
+        'k':        'k',
+        'kstar':    'k',
+        'mult':     'mult',
+        'kmult':    'mult',
+        'mult3d':   'mult3d',
+        'kmult3d':  'mult3d',
+        'rew3d':    'rew3d',
+        'rewmult':  'rew3d',
+        'mt':       'mt',
+        'kmt':      'mt',
+        'mt3d':     'mt3d',
+        'kmt3d':    'mt3d',
+        'mtmult':   'mtmult',
+        'kmtmult':  'mtmult',
+        'perc':     '4d',
+        '4d':       '4d',
+        '4dim':     '4d',
+        '4dims':    '4d',
+        'rew4d':    'rew4d',
+        'rewperc':  'rew4d',
+    }
+_DIFF3D_KEYS = {                # [diff3d, diff3d2]
+        'mult':     ('mult', 'mt'),
+        'kmult':    ('mult', 'mt'),
+        'mt':       ('mt', 'mult'),
+        'kmt':      ('mt', 'mult'),
+    }
+
 # generates the proper settings dictionary
 def config(dic_conf):
     """
@@ -1010,60 +1128,7 @@ def config(dic_conf):
             "print":        'True', 'False' -> print canvas as png
     """
 
-    # settings dictionary skeleton
-    dic = {
-            "function":         None,
-            "pair":             None,
-            "path":             "",
-            "file":             None,
-            "fullpath":         None,
-            "fileTDir":         "",
-            "nameSE":           "",
-            "nameME":           "",
-            "newfile":          None,
-            "mc":               None,
-            "mcTDir":           "",
-            "outDir":           "",
-            "rename":           None,
-            "bins":             None,
-            "bins3d":           None,
-            "diff3d":           "",
-            "diff3d2":          "",
-            "yield":            None,
-            "rebin":            None,
-            "atype":            None,
-            "htype":            None,
-            "tftype":           None,
-            "data":             None,
-            "templates":        None,
-            "temp_init":        None,
-            "temp_limits":      None,
-            "temp_fraction":    None,
-            "namelist":         None,
-            "fitrange":         None,
-            "percentile":       None,
-            "rewrange":         None,
-            "normalize":        None,
-            "include":          None,
-            "exclude":          None,
-            "debug":            False,
-            "print":            False,
-            "interactive":      False,
-        }
-
-    # keys to set values
-    keys_k      = ['k', 'kstar']
-    keys_mult   = ['mult', 'kmult']
-    keys_mult3d = ['mult3d', 'kmult3d']
-    keys_rew3d  = ['rew3d', 'rewmult']
-    keys_mt     = ['mt', 'kmt']
-    keys_mt3d   = ['mt3d', 'kmt3d']
-    keys_mtmult = ['mtmult','kmtmult']
-    keys_4d     = ['perc', '4d', '4dim', '4dims']
-    keys_rew4d  = ['rew4d', 'rewperc']
-
-    keys_int    = ['int', 'integrated']
-    keys_dif    = ['diff', 'dif', 'differential']
+    dic = dict(_CONFIG_DEFAULTS)
 
     # initialize values
     entries = ['function',      # function to be used
@@ -1135,38 +1200,16 @@ def config(dic_conf):
     # analysis type
     if 'atype' in dic_conf:
         atype = dic_conf['atype']
-        if type(atype) == str:
-            atype = atype.lower()
-        if atype in keys_int:
-            dic['atype'] = 'int'
-        elif atype in keys_dif:
-            dic['atype'] = 'dif'
+        if type(atype) == str and atype.lower() in _ATYPE_KEYS:
+            dic['atype'] = _ATYPE_KEYS[atype.lower()]
 
     # histogram type
     if 'htype' in dic_conf:
         htype = dic_conf['htype']
-        if type(htype) == str:
-            htype = htype.lower()
-        if htype in keys_4d:
-            dic['htype'] = '4d'
-        elif htype in keys_rew4d:
-            dic['htype'] = 'rew4d'
-            dic['diff3d'] = 'mt'
-        elif htype in keys_k:
-            dic['htype'] = 'k'
-        elif htype in keys_mult:
-            dic['htype'] = 'mult'
-        elif htype in keys_mult3d:
-            dic['htype'] = 'mult3d'
-        elif htype in keys_rew3d:
-            dic['htype'] = 'rew3d'
-            dic['diff3d'] = 'mt'
-        elif htype in keys_mt:
-            dic['htype'] = 'mt'
-        elif htype in keys_mt3d:
-            dic['htype'] = 'mt3d'
-        elif htype in keys_mtmult:
-            dic['htype'] = 'mtmult'
+        if type(htype) == str and htype.lower() in _HTYPE_KEYS:
+            dic['htype'] = _HTYPE_KEYS[htype.lower()]
+            if dic['htype'] in ['rew3d', 'rew4d']:
+                dic['diff3d'] = 'mt'
 
     # template fit type
     if 'tftype' in dic_conf:
@@ -1180,14 +1223,8 @@ def config(dic_conf):
     # which axis to be used for the first split in a 3D analysis
     if 'diff3d' in dic_conf:
         diff3d = dic_conf['diff3d']
-        if type(diff3d) == str:
-            diff3d = diff3d.lower()
-        if diff3d in keys_mult:
-            dic['diff3d'] = 'mult'
-            dic['diff3d2'] = 'mt'
-        elif diff3d in keys_mt:
-            dic['diff3d'] = 'mt'
-            dic['diff3d2'] = 'mult'
+        if type(diff3d) == str and diff3d.lower() in _DIFF3D_KEYS:
+            dic['diff3d'], dic['diff3d2'] = _DIFF3D_KEYS[diff3d.lower()]
 
     # yield setting to exclude systematic variations below a value of GeV that vary by a given percentage
     # input: [GeV, %]
@@ -1,4 +1,3 @@
-import ROOT
 import FileReader as FR
 
 class FemtoDreamReader(FR.FileReader):
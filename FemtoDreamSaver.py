@@ -1,4 +1,3 @@
-import ROOT
 import FileUtils as FU
 import FileSaver as FS
 
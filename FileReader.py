@@ -1,13 +1,24 @@
 import ROOT
 import FileUtils as FU
 
+# class objects used for type checks, resolved once at import
+_TH1_CLASS = ROOT.TH1.Class()
+_TLIST_CLASS = ROOT.TList.Class()
+_FOLDER_CLASSES = (ROOT.TDirectory.Class(), ROOT.TDirectoryFile.Class(), _TLIST_CLASS)
+_DIR_BOUND_CLASSES = (ROOT.TTree.Class(),
+                      ROOT.TChain.Class(),
+                      ROOT.TEventList.Class(),
+                      ROOT.TEntryList.Class(),
+                      ROOT.TGraph2D.Class())
+
 class FileReader:
     DEBUG = False
     def __init__(self, ifile, directory = None):
+        self._ifile = None
         ifile = FU.path_expand(ifile)
-        if not ROOT.gSystem.AccessPathName(ifile):
-            self._ifile = ROOT.TFile(ifile, "read")
-        else:
+        if FU.is_remote(ifile) or not ROOT.gSystem.AccessPathName(ifile):
+            self._ifile = FU.open_file(ifile)
+        if not self._ifile:
             print("File \"" + ifile + "\" not found!")
             return
         self._tree  = [self._ifile]
@@ -16,28 +27,14 @@ class FileReader:
             directory = FU.path_fix(directory)
             self._set_wdir(directory)
 
-    # find object in dir_obj
-    def _find_obj(self, obj_name, dir_obj):
-        obj = None
-        try:                # try to find in TDirectory
-            obj = dir_obj.Get(obj_name)
-        except:
-            pass
-        if not obj:         # try to find in TList
-            try:
-                obj = dir_obj.FindObject(obj_name)
-            except:
-                pass
-        return obj
-
     # set directory
     def _set_wdir(self, dir_name):
         dir_name = FU.path_fix(dir_name)
         name_list = dir_name.rsplit('/')
         for name in name_list:
-            dir_new = self._find_obj(name, self._wdir)              # find in current directory
+            dir_new = FU.find_obj(name, self._wdir)                 # find in current directory
             if not dir_new:
-                dir_new = self._find_obj(name, self._ifile)         # find in root directory
+                dir_new = FU.find_obj(name, self._ifile)            # find in root directory
                 if dir_new:
                     self._tree = [self._ifile]                      # if found in root dir, reset working directory path
             if not dir_new:
@@ -47,7 +44,7 @@ class FileReader:
                 return False
             self._tree.append(dir_new)                              # append dir to dir path
             self._wdir = dir_new
-            if dir_new.Class() == ROOT.TList.Class():
+            if dir_new.Class() == _TLIST_CLASS:
                 continue
             dir_new.cd()
         return True
@@ -56,45 +53,28 @@ class FileReader:
     def _get_obj(self, obj_name):
         obj_name = FU.path_fix(obj_name)
         name_list = obj_name.rsplit('/')
-        obj = self._find_obj(name_list[0], self._wdir)
+        obj = FU.find_obj(name_list[0], self._wdir)
         if not obj:
-            obj = self._find_obj(name_list[0], self._ifile)
+            obj = FU.find_obj(name_list[0], self._ifile)
         if not obj:
             if FileReader.DEBUG:
                 print("Object \"" + name_list[0] + "\" not found!")
             return None
         for name in name_list[1:]:
-            obj = self._find_obj(name, obj)
+            obj = FU.find_obj(name, obj)
             if not obj:
                 if FileReader.DEBUG:
                     print("Object \"" + name + "\" not found!")
                 return None
         return obj
 
+    # detach histograms and other directory bound objects from the file
     def _set_dir(self, obj):
-        classes = [ROOT.TTree.Class(),
-                   ROOT.TChain.Class(),
-                   ROOT.TEventList.Class(),
-                   ROOT.TEntryList.Class(),
-                   ROOT.TGraph2D.Class()]
-        if obj.InheritsFrom(ROOT.TH1.Class()):
-            obj.SetDirectory(0)
-        elif obj.Class() in classes:
+        if obj.InheritsFrom(_TH1_CLASS) or obj.Class() in _DIR_BOUND_CLASSES:
             obj.SetDirectory(0)
 
     # retrieves a histogram by name in the current directory
     # or if given, from the full path or a subdirectory
-    def get_histo(self, histo_name, dir_name = None):
-        dir_name = FU.path_fix(dir_name)
-        if not dir_name or dir_name == "":
-            histo = self._get_obj(histo_name)
-        else:
-            histo = self._get_obj(dir_name + '/' + histo_name)
-        if not histo:
-            return None
-        histo._set_dir(histo)
-        return histo
-
     def GetHisto(self, histo_name, dir_name = None):
         dir_name = FU.path_fix(dir_name)
         if not dir_name or dir_name == "":
@@ -106,36 +86,9 @@ class FileReader:
         self._set_dir(histo)
         return histo
 
-    # function to retrieve all histograms in a directory as a list
-    def get_histos(self, dir_name = None):
-        if dir_name:
-            new_name = FU.path_fix(dir_name)             # fix the path
-            directory = self._get_obj(new_name)             # set directory
-            if not directory:
-                print("Directory \"" + dir_name + "\" not found!")
-                return
-        else:
-            directory = self._wdir                          # find in current directory
-        histos = []
-        if directory.Class() == ROOT.TList.Class():         # for TList
-            lnk = directory.FirstLink()
-            lobj_ent = directory.GetEntries()
-        else:                                               # for TDirectory
-            lobj = directory.GetListOfKeys()
-            lobj_ent = lobj.GetEntries()
-            lnk = lobj.FirstLink()
-        for n in range(lobj_ent):                           # iterate over entries
-            if directory.Class() == ROOT.TList.Class():
-                obj = lnk.GetObject()
-            else:
-                obj = lnk.GetObject().ReadObj()
-            if obj.InheritsFrom(ROOT.TH1.Class()):          # check if its a derivative of TH1
-                histos.append(obj)
-            lnk = lnk.Next()
-        for hist in histos:
-            self._set_dir(hist)
-        return histos
+    get_histo = GetHisto
 
+    # function to retrieve all histograms in a directory as a list
     def GetHistos(self, dir_name = None):
         if dir_name:
             new_name = FU.path_fix(dir_name)             # fix the path
@@ -146,7 +99,8 @@ class FileReader:
         else:
             directory = self._wdir                          # find in current directory
         histos = []
-        if directory.Class() == ROOT.TList.Class():         # for TList
+        is_list = directory.Class() == _TLIST_CLASS
+        if is_list:                                         # for TList
             lnk = directory.FirstLink()
             lobj_ent = directory.GetEntries()
         else:                                               # for TDirectory
@@ -154,17 +108,18 @@ class FileReader:
             lobj_ent = lobj.GetEntries()
             lnk = lobj.FirstLink()
         for n in range(lobj_ent):                           # iterate over entries
-            if directory.Class() == ROOT.TList.Class():
-                obj = lnk.GetObject()
-            else:
-                obj = lnk.GetObject().ReadObj()
-            if obj.InheritsFrom(ROOT.TH1.Class()):          # check if its a derivative of TH1
+            obj = lnk.GetObject()
+            if not is_list:
+                obj = obj.ReadObj()
+            if obj.InheritsFrom(_TH1_CLASS):                # check if its a derivative of TH1
                 histos.append(obj)
             lnk = lnk.Next()
         for hist in histos:
             self._set_dir(hist)
         return histos
 
+    get_histos = GetHistos
+
     # function to retrieve a full directory as [name, [content]]
     # where content can include more directory structures
     def get_full_dir(self, dir_name = None):
@@ -177,8 +132,9 @@ class FileReader:
             directory = self._wdir
         content = [directory.GetName(), []]
 
-        if directory.Class() == ROOT.TList.Class():
-            lnk = directory.FirstLink
+        is_list = directory.Class() == _TLIST_CLASS
+        if is_list:
+            lnk = directory.FirstLink()
             lobj_ent = directory.GetEntries()
         else:
             lobj = directory.GetListOfKeys()
@@ -187,15 +143,12 @@ class FileReader:
 
         for n in range(lobj_ent):
             # read object
-            if directory.Class() == ROOT.TList.Class():
-                obj = lnk.GetObject()
-            else:
-                obj = lnk.GetObject().ReadObj()
+            obj = lnk.GetObject()
+            if not is_list:
+                obj = obj.ReadObj()
             # check if object is another folder
-            if obj.Class() == ROOT.TDirectory.Class() \
-                    or obj.Class() == ROOT.TDirectoryFile.Class() \
-                    or obj.Class() == ROOT.TList.Class():
-                        content[1].append(self.get_full_dir(obj.GetName()))
+            if obj.Class() in _FOLDER_CLASSES:
+                content[1].append(self.get_full_dir(obj.GetName()))
             else:
                 self._set_dir(obj)
                 content[1].append(obj)
@@ -254,12 +207,15 @@ class FileReader:
             print("dir: \"" + self._wdir.GetName() + "\"")
         return self._wdir.GetName()
 
+    GetDir = get_dir
+
     # return list of folders in current folder
     def get_folder_names(self):
         folders = []
         directory = self._wdir
-        if directory.Class() == ROOT.TList.Class():
-            lnk = directory.FirstLink
+        is_list = directory.Class() == _TLIST_CLASS
+        if is_list:
+            lnk = directory.FirstLink()
             lobj_ent = directory.GetEntries()
         else:
             lobj = directory.GetListOfKeys()
@@ -267,26 +223,17 @@ class FileReader:
             lnk = lobj.FirstLink()
 
         for n in range(lobj_ent):
-            if directory.Class() == ROOT.TList.Class():
-                obj = lnk.GetObject()
-            else:
-                obj = lnk.GetObject().ReadObj()
+            obj = lnk.GetObject()
+            if not is_list:
+                obj = obj.ReadObj()
 
             # check if object is another folder
-            if obj.Class() == ROOT.TDirectory.Class() \
-                    or obj.Class() == ROOT.TDirectoryFile.Class() \
-                    or obj.Class() == ROOT.TList.Class():
-                        folders.append(obj.GetName())
+            if obj.Class() in _FOLDER_CLASSES:
+                folders.append(obj.GetName())
 
             lnk = lnk.Next()
         return folders
 
-    # return current directory
-    def GetDir(self):
-        if FileReader.DEBUG:
-            print("dir: \"" + self._wdir.GetName() + "\"")
-        return self._wdir.GetName()
-
     # return file
     def GetFile(self):
         if FileReader.DEBUG:
@@ -304,5 +251,13 @@ class FileReader:
             return
         FileReader.DEBUG = not FileReader.DEBUG
 
+    # allows the usage as context manager, the file is closed when leaving the 'with' block
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
     def Close(self):
-        self._ifile.Close()
+        if self._ifile and self._ifile.IsOpen():
+            self._ifile.Close()
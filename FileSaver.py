@@ -1,6 +1,9 @@
 import ROOT
 import FileUtils as FU
 
+# class object used for type checks, resolved once at import
+_TLIST_CLASS = ROOT.TList.Class()
+
 # class that handles the saving of the histograms in the correct file structure
 class FileSaver():
     DEBUG = False
@@ -46,7 +49,7 @@ class FileSaver():
             self.write(objects)
         except:
             if FileSaver.DEBUG:
-                print("\nFileSaver: could not save \"" + objects + "\" in \"" + dir_name + "\"!\n")
+                print("\nFileSaver: could not save \"" + str(objects) + "\" in \"" + dir_name + "\"!\n")
             pass
         dir_root.cd()
         del dir_new
@@ -89,8 +92,8 @@ class FileSaver():
         else:
             # 0 is the root directory of the file
             if dir_name == 0:
-                self._wdir = self._ifile
-                self._tree = [self._ifile]              # reset working directory list
+                self._wdir = self._file
+                self._tree = [self._file]               # reset working directory list
                 return
             elif type(dir_name) == int:
                 for n in range(dir_name):
@@ -106,11 +109,11 @@ class FileSaver():
         dir_name = FU.path_fix(dir_name)
         name_list = dir_name.rsplit('/')
         for name in name_list:
-            dir_new = self._find_obj(name, self._wdir)              # find in current directory
+            dir_new = FU.find_obj(name, self._wdir)                 # find in current directory
             if not dir_new:
-                dir_new = self._find_obj(name, self._ifile)         # find in root directory
+                dir_new = FU.find_obj(name, self._file)             # find in root directory
                 if dir_new:
-                    self._tree = [self._ifile]                      # if found in root dir, reset working directory path
+                    self._tree = [self._file]                       # if found in root dir, reset working directory path
             if not dir_new:
                 if FileSaver.DEBUG:
                     print("\nDirectory \"" + name + "\" not found!\n")
@@ -118,26 +121,10 @@ class FileSaver():
                 return None
             self._tree.append(dir_new)                              # append dir to dir path
             self._wdir = dir_new
-            if dir_new.Class() == ROOT.TList.Class():
+            if dir_new.Class() == _TLIST_CLASS:
                 continue
             dir_new.cd()
 
-    # find object in dir_obj
-    def _find_obj(self, obj_name, dir_obj):
-        obj = None
-        try:                # try to find in TDirectory
-            obj = dir_obj.Get(obj_name)
-        except:
-            pass
-        if not obj:         # try to find in tlist
-            try:
-                obj = dir_obj.findobject(obj_name)
-            except:
-                if FileSaver.DEBUG:
-                    print("\nFileSaver: object \"" + obj_name + "\" not found in \"" + dir_obj + "\"!\n")
-                pass
-        return obj
-
     # toggle debug output or set with 'option'
     def setDebug(option = None):
         if type(option) == bool:
@@ -164,13 +151,13 @@ class FileSaver():
             return self._file.GetName()
         for obj in self._tree[1:]:
             pwd += obj.GetName() + "/"
-        if FileReader.DEBUG:
+        if FileSaver.DEBUG:
             print("pwd: \"" + pwd + "\"")
         return pwd
 
     # return current directory
     def get_dir(self):
-        if FileReader.DEBUG:
+        if FileSaver.DEBUG:
             print("dir: \"" + self._wdir.GetName() + "\"")
         return self._wdir.GetName()
 
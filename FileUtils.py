@@ -1,4 +1,10 @@
 import ROOT
+import glob
+import re
+
+# class objects used for type checks in find_obj, resolved once at import
+_TDIRECTORY_CLASS = ROOT.TDirectory.Class()
+_TCOLLECTION_CLASS = ROOT.TCollection.Class()
 
 # expand ~ to home directory
 def path_expand(ifile):
@@ -20,14 +26,14 @@ def path_fix(dir_name):
         dir_name = ""
     return dir_name
 
-# function that looks if 'file' exists and if yes it appends -n, where n depends on if another file was already created
+# function that looks if 'file' exists and if yes it appends _n, where n is one more than the highest existing _n
 def file_exists(file):
     file = path_expand(file)
     if not ROOT.gSystem.AccessPathName(file):
-        name, ext = file.rsplit('.')
-        digit = 1
-        while not ROOT.gSystem.AccessPathName(name + '_' + str(digit) + '.' + ext):
-            digit += 1
+        name, ext = file.rsplit('.', 1)
+        pattern = re.compile(re.escape(name) + r'_(\d+)\.' + re.escape(ext) + '$')
+        matches = [pattern.match(f) for f in glob.glob(glob.escape(name) + '_*.' + glob.escape(ext))]
+        digit = max([int(m.group(1)) for m in matches if m], default = 0) + 1
         file = name + '_' + str(digit) + '.' + ext
     return file
 
@@ -37,3 +43,32 @@ def find_bin_reduce_on_lower_edge(axis, value):
     if value == axis.GetBinLowEdge(found_bin):
         found_bin -= 1
     return found_bin
+
+# returns True if 'ifile' is a remote url like root:// or https://
+def is_remote(ifile):
+    return '://' in ifile
+
+# open 'ifile' for reading, returns None if it can't be opened
+# remote files are copied once to a local cache directory and read from there
+def open_file(ifile):
+    if is_remote(ifile):
+        if not ROOT.TFile.GetCacheFileDir():
+            ROOT.TFile.SetCacheFileDir(ROOT.gSystem.TempDirectory() + "/uffa_cache/")
+        tfile = ROOT.TFile.Open(ifile, "CACHEREAD")
+    else:
+        tfile = ROOT.TFile(ifile, "read")
+    if not tfile or tfile.IsZombie():
+        return None
+    return tfile
+
+# find object in dir_obj, which can be a TDirectory or a TList
+def find_obj(obj_name, dir_obj):
+    if dir_obj.InheritsFrom(_TDIRECTORY_CLASS):
+        obj = dir_obj.GetList().FindObject(obj_name)    # already read objects
+        if not obj:
+            key = dir_obj.GetKey(obj_name)              # hashed lookup instead of a scan of all keys
+            obj = key.ReadObj() if key else dir_obj.Get(obj_name)
+        return obj
+    if dir_obj.InheritsFrom(_TCOLLECTION_CLASS):  # TList
+        return dir_obj.FindObject(obj_name)
+    return None
@@ -0,0 +1,52 @@
+import ROOT
+import numpy as np
+
+# returns the bin contents of 'hist' as float64 numpy array of all cells, i.e. including under- and overflow
+# for TH2 the array can be reshaped to [ybin, xbin] with reshape(nbinsy + 2, nbinsx + 2)
+def get_content(hist):
+    ncells = hist.GetNcells()
+    if isinstance(hist, ROOT.TArrayD):
+        return np.frombuffer(hist.GetArray(), dtype = np.float64, count = ncells).copy()
+    if isinstance(hist, ROOT.TArrayF):
+        return np.frombuffer(hist.GetArray(), dtype = np.float32, count = ncells).astype(np.float64)
+    return np.array([hist.GetBinContent(n) for n in range(ncells)], dtype = np.float64)
+
+# returns the squared bin errors of 'hist' as float64 numpy array of all cells
+def get_errors2(hist):
+    if hist.GetSumw2N():
+        return np.frombuffer(hist.GetSumw2().GetArray(), dtype = np.float64, count = hist.GetNcells()).copy()
+    return np.abs(get_content(hist))
+
+# sets the bin contents of all cells of 'hist' from a numpy array in the layout of get_content()
+def set_content(hist, content):
+    hist.SetContent(np.ascontiguousarray(content, dtype = np.float64).ravel())
+    hist.ResetStats()
+
+# returns the bin edges of 'axis' as numpy array
+def get_bin_edges(axis):
+    nbins = axis.GetNbins()
+    if axis.GetXbins().GetSize():
+        return np.frombuffer(axis.GetXbins().GetArray(), dtype = np.float64, count = nbins + 1).copy()
+    return np.linspace(axis.GetXmin(), axis.GetXmax(), nbins + 1)
+
+# returns the bin centers of 'axis' as numpy array
+def get_bin_centers(axis):
+    nbins = axis.GetNbins()
+    if axis.GetXbins().GetSize():
+        edges = get_bin_edges(axis)
+        return 0.5 * (edges[:-1] + edges[1:])
+    width = (axis.GetXmax() - axis.GetXmin()) / nbins
+    return axis.GetXmin() + (np.arange(1, nbins + 1) - 0.5) * width
+
+# vectorized TAxis::FindBin for an array of values, returns 0 for underflow and nbins + 1 for overflow
+def find_bins(axis, values):
+    values = np.asarray(values, dtype = np.float64)
+    nbins = axis.GetNbins()
+    xmin = axis.GetXmin()
+    xmax = axis.GetXmax()
+    if axis.GetXbins().GetSize():
+        return np.searchsorted(get_bin_edges(axis), values, side = 'right')
+    bins = 1 + (nbins * (values - xmin) / (xmax - xmin)).astype(np.int64)
+    bins[values < xmin] = 0
+    bins[values >= xmax] = nbins + 1
+    return bins
@@ -1,5 +1,5 @@
 import ROOT
-import FemtoAnalysis as FA
+import FileUtils as FU
 import array as arr
 
 class ftotal():
@@ -15,12 +15,6 @@ class ftotal():
 
         return total
 
-def find_bin_reduce_on_lower_edge(axis, value):
-    found_bin = axis.FindBin(value)
-    if value == axis.GetBinLowEdge(found_bin):
-        found_bin -= 1
-    return found_bin
-
 def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, pt_bins, pt_rebin, dirOut, temp_init, temp_limits, temp_fraction):
     xAxis = dca_data.GetXaxis()
     yAxis = dca_data.GetYaxis()
@@ -46,7 +40,7 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, pt
         pt_range = []
         for i in range(pt_ent):
             bin_value1 = xAxis.FindBin(pt_bins[i])
-            bin_value2 = find_bin_reduce_on_lower_edge(xAxis, pt_bins[i + 1])
+            bin_value2 = FU.find_bin_reduce_on_lower_edge(xAxis, pt_bins[i + 1])
             pt_range.append((bin_value1, bin_value2))
     else:
         print("TemplateFit.py: pt_bins not an int or list of ranges: " + pt_bins)
@@ -101,18 +95,20 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, pt
     gDCA_mc = []
     for n in range(dca_ent):
         parDCA_mc.append([])
-        gDCA_mc.append(ROOT.TGraph(pt_ent - 1))
-        gDCA_mc[n].SetName(dca_names[n])
-        gDCA_mc[n].SetTitle(dca_names[n])
-        gDCA_mc[n].SetLineWidth(2)
-        gDCA_mc[n].SetLineColor(n + 3)
-        gDCA_mc[n].SetMarkerStyle(21)
-        gDCA_mc[n].SetMarkerSize(1)
-        gDCA_mc[n].SetMarkerColor(n + 3)
-        gDCA_mc[n].GetXaxis().SetLabelSize(0.05)
-        gDCA_mc[n].GetYaxis().SetLabelSize(0.05)
-        gDCA_mc[n].GetXaxis().SetTitleSize(0.05)
-        gDCA_mc[n].GetXaxis().SetTitle("<p_{T}> (GeV)")
+        graph = ROOT.TGraph(pt_ent - 1)
+        gx = graph.GetXaxis()
+        graph.SetName(dca_names[n])
+        graph.SetTitle(dca_names[n])
+        graph.SetLineWidth(2)
+        graph.SetLineColor(n + 3)
+        graph.SetMarkerStyle(21)
+        graph.SetMarkerSize(1)
+        graph.SetMarkerColor(n + 3)
+        gx.SetLabelSize(0.05)
+        graph.GetYaxis().SetLabelSize(0.05)
+        gx.SetTitleSize(0.05)
+        gx.SetTitle("<p_{T}> (GeV)")
+        gDCA_mc.append(graph)
 
     # main loop for fitting
     for n in range(pt_ent):
@@ -259,13 +255,15 @@ def TemplateFit(fname, dca_data, dca_templates, dcacpa, dca_names, fit_range, pt
         pT_Weights.SetBinContent(i, dataEntries[i] / m2tot)
 
     # chi2 graph
+    gx = gChi.GetXaxis()
+    gy = gChi.GetYaxis()
     gChi.SetLineWidth(2)
-    gChi.GetXaxis().SetLabelSize(0.05)
-    gChi.GetYaxis().SetLabelSize(0.05)
-    gChi.GetYaxis().SetTitle("chi2/ndf")
-    gChi.GetXaxis().SetTitle("<p_{T}> (GeV)")
-    gChi.GetXaxis().SetTitleSize(0.05)
-    gChi.GetYaxis().SetTitleSize(0.05)
+    gx.SetLabelSize(0.05)
+    gy.SetLabelSize(0.05)
+    gy.SetTitle("chi2/ndf")
+    gx.SetTitle("<p_{T}> (GeV)")
+    gx.SetTitleSize(0.05)
+    gy.SetTitleSize(0.05)
 
     # canvas for all fractions
     fractions = ROOT.TCanvas("fractions", "fractions", 1024, 768)